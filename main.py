@@ -114,38 +114,41 @@ def main():
     config = AppConfig()
     if file_arg:
         # Standalone viewer mode — silently ensure config exists
-        if not config.is_first_run():
+        if config.is_first_run():
+            config.save()
+        else:
             config.load()
-        config.save()
         _cleanup_updates_on_launch(config)
 
         from src.standalone_viewer import StandaloneViewer
         controller = StandaloneViewer(file_arg, config)
     elif pdf_arg:
         # Standalone PDF viewer mode
-        if not config.is_first_run():
+        if config.is_first_run():
+            config.save()
+        else:
             config.load()
-        config.save()
         _cleanup_updates_on_launch(config)
 
         from src.standalone_pdf_viewer import StandalonePDFViewer
         controller = StandalonePDFViewer(pdf_arg, config)
     else:
         # Normal gallery mode
-        from src.first_run import FirstRunDialog
-        from src.main_window import MainWindow
-
         if config.is_first_run():
+            from src.first_run import FirstRunDialog
+
             dlg = FirstRunDialog(config)
             if dlg.exec() == 0:  # rejected / closed
                 sys.exit(0)
         else:
             config.load()
-            config.save()  # ensure dirs exist
 
         _cleanup_updates_on_launch(config)
 
-        # Main window
+        # Main window — imported late so the gallery widgets, Pillow and the
+        # workers are only resolved once the QApplication is up.
+        from src.main_window import MainWindow
+
         window = MainWindow(config)
         window.show()
 
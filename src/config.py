@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 
 APP_NAME = "Ash Album"
@@ -22,7 +23,26 @@ ALL_EXTENSIONS_WITH_PDF = ALL_EXTENSIONS | PDF_EXTENSIONS
 THUMB_SIZE = 180
 
 
-def _build_scan_folders() -> list[Path]:
+def _existing_unique(candidates: list[Path]) -> tuple[Path, ...]:
+    """Drop duplicate and missing folders, keeping the first occurrence.
+
+    Duplicates are detected lexically (``normcase`` folds case on Windows),
+    so the only filesystem access is one ``is_dir`` per unique candidate.
+    """
+    seen: set[str] = set()
+    result: list[Path] = []
+    for folder in candidates:
+        key = os.path.normcase(os.path.normpath(os.fspath(folder)))
+        if key in seen:
+            continue
+        seen.add(key)
+        if folder.is_dir():
+            result.append(folder)
+    return tuple(result)
+
+
+@lru_cache(maxsize=1)
+def _build_scan_folders() -> tuple[Path, ...]:
     """Detect all directories to scan, including OneDrive-redirected folders."""
     home = Path.home()
     candidates = [
@@ -42,22 +62,11 @@ def _build_scan_folders() -> list[Path]:
                 od_path / "Desktop",
                 od_path / "Documents",
             ])
-    # Deduplicate by resolved path (case-insensitive on Windows)
-    seen: set[str] = set()
-    result: list[Path] = []
-    for folder in candidates:
-        try:
-            resolved = str(folder.resolve())
-        except OSError:
-            resolved = str(folder)
-        key = resolved.lower()
-        if key not in seen and folder.exists():
-            result.append(folder)
-            seen.add(key)
-    return result
+    return _existing_unique(candidates)
 
 
-def _build_screenshot_folders() -> list[Path]:
+@lru_cache(maxsize=1)
+def _build_screenshot_folders() -> tuple[Path, ...]:
     """Return all possible screenshot folder paths that exist on disk."""
     home = Path.home()
     candidates = [home / "Pictures" / "Screenshots"]
@@ -65,21 +74,28 @@ def _build_screenshot_folders() -> list[Path]:
         od = os.environ.get(env_key)
         if od:
             candidates.append(Path(od) / "Pictures" / "Screenshots")
-    seen: set[str] = set()
-    result: list[Path] = []
-    for f in candidates:
-        try:
-            resolved = str(f.resolve()).lower()
-        except OSError:
-            resolved = str(f).lower()
-        if resolved not in seen and f.exists():
-            result.append(f)
-            seen.add(resolved)
-    return result
+    return _existing_unique(candidates)
+
+
+_LAZY_FOLDERS = {
+    "SCAN_FOLDERS": _build_scan_folders,
+    "SCREENSHOT_FOLDERS": _build_screenshot_folders,
+}
 
 
-SCAN_FOLDERS = _build_scan_folders()
-SCREENSHOT_FOLDERS = _build_screenshot_folders()
+def __getattr__(name: str):
+    """Build SCAN_FOLDERS / SCREENSHOT_FOLDERS on first access (PEP 562).
+
+    Importing this module stays free of filesystem work; the folders are
+    probed only when the scanner or main window first asks for them.
+    """
+    builder = _LAZY_FOLDERS.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = list(builder())
+    globals()[name] = value
+    return value
+
 
 SORT_OPTIONS = [
     ("Name (A → Z)", "name_asc"),
@@ -96,40 +112,69 @@ SORT_OPTIONS = [
 class AppConfig:
     """Manages application configuration persisted to disk."""
 
+    __slots__ = (
+        "base_dir",
+        "default_app_asked",
+        "cache_dir",
+        "hidden_dir",
+        "config_file",
+        "_dirs_ensured",
+        "_loaded_mtime_ns",
+    )
+
     def __init__(self):
         self.base_dir: Path = DEFAULT_BASE_DIR
         self.default_app_asked: bool = False
+        self._dirs_ensured = False
+        self._loaded_mtime_ns = 0  # mtime of config.json when last loaded/saved
         self._update_dirs()
 
     # ---- public API ----
 
     def load(self) -> bool:
         """Load config from disk. Returns True if config existed."""
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, "r", encoding="utf-8") as fh:
-                    data = json.load(fh)
-                self.base_dir = Path(data.get("base_dir", str(DEFAULT_BASE_DIR)))
-                self.default_app_asked = data.get("default_app_asked", False)
-                self._update_dirs()
-                return True
-            except Exception:
-                pass
+        try:
+            mtime_ns = self.config_file.stat().st_mtime_ns
+        except OSError:
+            return False
+        if mtime_ns == self._loaded_mtime_ns:
+            return True  # unchanged since we last read or wrote it
+        try:
+            data = json.loads(self.config_file.read_bytes())
+            self.base_dir = Path(data.get("base_dir", str(DEFAULT_BASE_DIR)))
+            self.default_app_asked = data.get("default_app_asked", False)
+            self._update_dirs()
+            self._loaded_mtime_ns = mtime_ns
+            return True
+        except Exception:
+            pass
         return False
 
     def save(self):
-        """Ensure directories exist and persist config."""
-        self.base_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.hidden_dir.mkdir(parents=True, exist_ok=True)
+        """Ensure directories exist and persist config.
+
+        The file is only rewritten when its contents would change.
+        """
+        self._ensure_dirs()
+        payload = json.dumps({
+            "base_dir": str(self.base_dir),
+            "default_app_asked": self.default_app_asked,
+        }, indent=2)
+        try:
+            if self.config_file.read_text(encoding="utf-8") == payload:
+                return
+        except OSError:
+            pass
         with open(self.config_file, "w", encoding="utf-8") as fh:
-            json.dump({
-                "base_dir": str(self.base_dir),
-                "default_app_asked": self.default_app_asked,
-            }, fh, indent=2)
+            fh.write(payload)
+        try:
+            self._loaded_mtime_ns = self.config_file.stat().st_mtime_ns
+        except OSError:
+            self._loaded_mtime_ns = 0
 
     def set_base_dir(self, path: str | Path):
         self.base_dir = Path(path)
+        self._loaded_mtime_ns = 0
         self._update_dirs()
 
     def is_first_run(self) -> bool:
@@ -141,3 +186,14 @@ class AppConfig:
         self.cache_dir: Path = self.base_dir / "cache"
         self.hidden_dir: Path = self.base_dir / "hidden"
         self.config_file: Path = self.base_dir / "config.json"
+        self._dirs_ensured = False
+
+    def _ensure_dirs(self):
+        """Create the data folders once; later calls are a no-op."""
+        if self._dirs_ensured:
+            return
+        if not (self.base_dir.is_dir() and self.cache_dir.is_dir() and self.hidden_dir.is_dir()):
+            self.base_dir.mkdir(parents=True, exist_ok=True)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self.hidden_dir.mkdir(parents=True, exist_ok=True)
+        self._dirs_ensured = True
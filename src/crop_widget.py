@@ -5,18 +5,19 @@ Ash Album — Crop dialog with rubber-band rectangle selection.
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from PySide6.QtCore import Qt, QRect, QPoint, Signal
+from PySide6.QtCore import Qt, QRect, QPoint, QSize, QTimer, Signal
 from PySide6.QtGui import (
-    QBrush,
     QColor,
     QFont,
+    QImageReader,
     QPainter,
-    QPainterPath,
     QPen,
     QPixmap,
 )
 from PySide6.QtWidgets import (
+    QApplication,
     QDialog,
     QFileDialog,
     QHBoxLayout,
@@ -28,10 +29,16 @@ from PySide6.QtWidgets import (
     QSizePolicy,
 )
 
-from PIL import Image as PILImage
-
 from .theme import COLORS
 
+if TYPE_CHECKING:
+    from PIL import Image as PILImage
+
+# Paint resources shared by every canvas instance
+_BG_COLOR = QColor("#0a0a12")
+_DIM_COLOR = QColor(0, 0, 0, 140)
+_SEL_PEN = QPen(QColor(COLORS["accent"]), 2, Qt.PenStyle.DashLine)
+
 
 # ────────────────────────────────────────────────────────────
 #  Canvas that lets the user draw a crop rectangle
@@ -42,17 +49,27 @@ class _CropCanvas(QWidget):
 
     selection_changed = Signal(QRect)   # rect in *original-image* coords
 
-    def __init__(self, pixmap: QPixmap, parent=None):
+    def __init__(self, pixmap: QPixmap, source_size: QSize | None = None, parent=None):
         super().__init__(parent)
         self._src_pm = pixmap
+        # Pixel size of the file on disk; the pixmap may be a downscaled preview.
+        self._source_w = source_size.width() if source_size and source_size.isValid() else pixmap.width()
         self._sel = QRect()             # selection in widget coords
         self._drawing = False
         self._origin = QPoint()
 
-        # Computed each paint
+        # Cached per widget size (see _ensure_scaled).  A cheap fast-scaled
+        # pixmap is shown immediately; the smooth one replaces it once the
+        # user is not dragging.
+        self._pm_fast: QPixmap | None = None
+        self._pm_smooth: QPixmap | None = None
         self._img_rect = QRect()        # where the image is drawn
         self._scale = 1.0
 
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.timeout.connect(self._build_smooth)
+
         self.setMinimumSize(400, 300)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.setCursor(Qt.CursorShape.CrossCursor)
@@ -68,49 +85,91 @@ class _CropCanvas(QWidget):
 
     def mouseMoveEvent(self, ev):
         if self._drawing:
+            old = self._sel
             self._sel = QRect(self._origin, ev.pos()).normalized()
-            self.update()
+            if self._has_overlay(old) and self._has_overlay(self._sel):
+                # Only the union of old and new selection changes (plus the 2px border)
+                self.update(old.united(self._sel).adjusted(-2, -2, 2, 2))
+            else:
+                # The dim overlay appears or vanishes across the whole canvas
+                self.update()
 
     def mouseReleaseEvent(self, ev):
         if ev.button() == Qt.MouseButton.LeftButton and self._drawing:
             self._drawing = False
+            if self._pm_smooth is None:
+                self._smooth_timer.start(0)
             self.update()
             self.selection_changed.emit(self._map_to_original(self._sel))
 
     # ---- painting ----
 
-    def paintEvent(self, ev):
-        p = QPainter(self)
-        p.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+    @staticmethod
+    def _has_overlay(sel: QRect) -> bool:
+        """Whether *sel* is large enough for the dim overlay to be drawn."""
+        return not sel.isNull() and sel.width() > 2 and sel.height() > 2
+
+    def resizeEvent(self, ev):
+        super().resizeEvent(ev)
+        self._pm_fast = None
+        self._pm_smooth = None
+        self._smooth_timer.start(120)
+
+    def _ensure_scaled(self) -> QPixmap:
+        """Scale the source to fit the widget, reusing it until the next resize."""
+        if self._pm_smooth is not None:
+            return self._pm_smooth
+        if self._pm_fast is None:
+            scaled = self._src_pm.scaled(
+                self.size(),
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.FastTransformation,
+            )
+            self._set_image_geometry(scaled)
+            self._pm_fast = scaled
+        return self._pm_fast
 
-        # Black background
-        p.fillRect(self.rect(), QColor("#0a0a12"))
+    def _set_image_geometry(self, scaled: QPixmap):
+        dx = (self.width() - scaled.width()) // 2
+        dy = (self.height() - scaled.height()) // 2
+        self._img_rect = QRect(dx, dy, scaled.width(), scaled.height())
+        self._scale = self._source_w / scaled.width() if scaled.width() else 1.0
 
-        # Scale image to fit
-        scaled = self._src_pm.scaled(
+    def _build_smooth(self):
+        """Replace the fast preview with a smooth-scaled one (idle only)."""
+        if self._drawing:
+            return  # retried from mouseReleaseEvent
+        self._pm_smooth = self._src_pm.scaled(
             self.size(),
             Qt.AspectRatioMode.KeepAspectRatio,
             Qt.TransformationMode.SmoothTransformation,
         )
-        dx = (self.width() - scaled.width()) // 2
-        dy = (self.height() - scaled.height()) // 2
-        self._img_rect = QRect(dx, dy, scaled.width(), scaled.height())
-        self._scale = self._src_pm.width() / scaled.width() if scaled.width() else 1.0
-        p.drawPixmap(dx, dy, scaled)
+        self._set_image_geometry(self._pm_smooth)
+        self.update()
+
+    def paintEvent(self, ev):
+        p = QPainter(self)
+        p.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+
+        # Black background
+        p.fillRect(self.rect(), _BG_COLOR)
+
+        # Scale image to fit (cached between repaints)
+        scaled = self._ensure_scaled()
+        p.drawPixmap(self._img_rect.topLeft(), scaled)
 
         # Dim overlay outside selection
-        if not self._sel.isNull() and self._sel.width() > 2 and self._sel.height() > 2:
-            overlay = QPainterPath()
-            overlay.addRect(float(self.rect().x()), float(self.rect().y()),
-                            float(self.rect().width()), float(self.rect().height()))
-            hole = QPainterPath()
-            hole.addRect(float(self._sel.x()), float(self._sel.y()),
-                         float(self._sel.width()), float(self._sel.height()))
-            overlay = overlay.subtracted(hole)
-            p.fillPath(overlay, QBrush(QColor(0, 0, 0, 140)))
+        if self._has_overlay(self._sel):
+            # Four axis-aligned strips around the hole (top, bottom, left, right)
+            s = self._sel.intersected(self.rect())
+            w, h = self.width(), self.height()
+            p.fillRect(0, 0, w, s.top(), _DIM_COLOR)
+            p.fillRect(0, s.bottom() + 1, w, h - s.bottom() - 1, _DIM_COLOR)
+            p.fillRect(0, s.top(), s.left(), s.height(), _DIM_COLOR)
+            p.fillRect(s.right() + 1, s.top(), w - s.right() - 1, s.height(), _DIM_COLOR)
 
             # Selection border
-            p.setPen(QPen(QColor(COLORS["accent"]), 2, Qt.PenStyle.DashLine))
+            p.setPen(_SEL_PEN)
             p.setBrush(Qt.BrushStyle.NoBrush)
             p.drawRect(self._sel)
 
@@ -124,11 +183,12 @@ class _CropCanvas(QWidget):
         clamped = r.intersected(self._img_rect)
         if clamped.isNull():
             return QRect()
-        ox = int((clamped.x() - self._img_rect.x()) * self._scale)
-        oy = int((clamped.y() - self._img_rect.y()) * self._scale)
-        ow = int(clamped.width() * self._scale)
-        oh = int(clamped.height() * self._scale)
-        return QRect(ox, oy, ow, oh)
+        clamped.translate(-self._img_rect.x(), -self._img_rect.y())
+        s = self._scale
+        return QRect(
+            int(clamped.x() * s), int(clamped.y() * s),
+            int(clamped.width() * s), int(clamped.height() * s),
+        )
 
     def get_selection_original(self) -> QRect:
         return self._map_to_original(self._sel)
@@ -155,64 +215,46 @@ class CropDialog(QDialog):
         self.showMaximized()
 
     def _build_ui(self):
-        self.setStyleSheet(f"background-color: {COLORS['bg_darkest']};")
+        self.setObjectName("cropDialog")
 
         root = QVBoxLayout(self)
         root.setContentsMargins(0, 0, 0, 0)
         root.setSpacing(0)
 
         # Canvas
-        pm = QPixmap(self._path)
-        self._canvas = _CropCanvas(pm, self)
+        pm, source_size = self._load_preview()
+        self._canvas = _CropCanvas(pm, source_size, self)
         self._canvas.selection_changed.connect(self._on_selection)
         root.addWidget(self._canvas, 1)
 
         # Bottom bar
         bar = QWidget()
         bar.setFixedHeight(60)
-        bar.setStyleSheet(f"background-color: {COLORS['bg_mid']};")
+        bar.setObjectName("cropBar")
         blay = QHBoxLayout(bar)
         blay.setContentsMargins(16, 0, 16, 0)
         blay.setSpacing(12)
 
         self._info = QLabel("Draw a rectangle on the image to crop")
-        self._info.setStyleSheet(f"color: {COLORS['text_dim']}; font-size: 12px;")
+        self._info.setObjectName("dimLabel")
 
         btn_cancel = QPushButton("Cancel")
         btn_cancel.setFixedHeight(36)
         btn_cancel.setCursor(Qt.CursorShape.PointingHandCursor)
-        btn_cancel.setStyleSheet(
-            f"QPushButton {{ background-color: {COLORS['bg_lighter']}; color: {COLORS['text']}; "
-            f"border: 1px solid {COLORS['border']}; border-radius: 8px; "
-            f"padding: 6px 20px; font-weight: 700; font-size: 12px; }}"
-            f"QPushButton:hover {{ background-color: {COLORS['accent']}; color: #fff; "
-            f"border-color: {COLORS['accent']}; }}"
-        )
+        btn_cancel.setObjectName("cropCancelBtn")
         btn_cancel.clicked.connect(self.reject)
 
         self._btn_overwrite = QPushButton("Overwrite Original")
         self._btn_overwrite.setFixedHeight(36)
         self._btn_overwrite.setCursor(Qt.CursorShape.PointingHandCursor)
-        self._btn_overwrite.setStyleSheet(
-            f"QPushButton {{ background-color: {COLORS['danger']}; color: #ffffff; "
-            f"border: none; border-radius: 8px; padding: 6px 20px; "
-            f"font-weight: 700; font-size: 12px; }}"
-            f"QPushButton:hover {{ background-color: #f44336; }}"
-            f"QPushButton:disabled {{ background-color: {COLORS['bg_light']}; color: {COLORS['text_muted']}; }}"
-        )
+        self._btn_overwrite.setObjectName("cropOverwriteBtn")
         self._btn_overwrite.setEnabled(False)
         self._btn_overwrite.clicked.connect(self._do_overwrite)
 
         self._btn_saveas = QPushButton("Save as New File")
         self._btn_saveas.setFixedHeight(36)
         self._btn_saveas.setCursor(Qt.CursorShape.PointingHandCursor)
-        self._btn_saveas.setStyleSheet(
-            f"QPushButton {{ background-color: {COLORS['accent']}; color: #ffffff; "
-            f"border: none; border-radius: 8px; padding: 6px 20px; "
-            f"font-weight: 700; font-size: 12px; }}"
-            f"QPushButton:hover {{ background-color: {COLORS['accent_hover']}; }}"
-            f"QPushButton:disabled {{ background-color: {COLORS['bg_light']}; color: {COLORS['text_muted']}; }}"
-        )
+        self._btn_saveas.setObjectName("cropSaveAsBtn")
         self._btn_saveas.setEnabled(False)
         self._btn_saveas.clicked.connect(self._do_save_as)
 
@@ -223,6 +265,26 @@ class CropDialog(QDialog):
 
         root.addWidget(bar)
 
+    def _load_preview(self) -> tuple[QPixmap, QSize]:
+        """Decode the image for display, capped at twice the screen size.
+
+        Returns the preview pixmap and the original pixel size so the canvas
+        can still map selections back to full-resolution coordinates.
+        """
+        reader = QImageReader(self._path)
+        # Stored orientation, like the PIL crop in _crop_image, so the
+        # preview and source_size share axes
+        reader.setAutoTransform(False)
+        source_size = reader.size()
+        screen = QApplication.primaryScreen()
+        if screen is not None and source_size.isValid():
+            limit = screen.availableGeometry().size() * 2
+            if source_size.width() > limit.width() or source_size.height() > limit.height():
+                reader.setScaledSize(
+                    source_size.scaled(limit, Qt.AspectRatioMode.KeepAspectRatio)
+                )
+        return QPixmap.fromImage(reader.read()), source_size
+
     # ---- slots ----
 
     def _on_selection(self, rect: QRect):
@@ -242,10 +304,17 @@ class CropDialog(QDialog):
         r = self._last_rect   # use the rect captured at mouse-release time
         if r.isNull() or r.width() < 2 or r.height() < 2:
             return None
+        # Pillow is only needed once the user actually crops.
+        from PIL import Image as PILImage
+
         try:
-            img = PILImage.open(self._path)
             box = (r.x(), r.y(), r.x() + r.width(), r.y() + r.height())
-            return img.crop(box)
+            with PILImage.open(self._path) as img:
+                cropped = img.crop(box)
+                # Materialise the region so the source file can be closed
+                # (and overwritten) without keeping the full decode around.
+                cropped.load()
+            return cropped
         except Exception:
             return None
 
@@ -23,7 +23,6 @@ from .default_app import (
     open_default_apps_settings,
     set_default_button_hidden,
 )
-from .theme import COLORS
 
 
 class FirstRunDialog(QDialog):
@@ -80,18 +79,14 @@ class FirstRunDialog(QDialog):
         )
         info.setAlignment(Qt.AlignCenter)
         info.setWordWrap(True)
-        info.setStyleSheet(f"color: {COLORS['text_dim']}; font-size: 12px;")
+        info.setObjectName("dimLabel")
         lay.addWidget(info)
 
         lay.addSpacing(10)
 
         self._path_label = QLabel(str(self.config.base_dir))
         self._path_label.setAlignment(Qt.AlignCenter)
-        self._path_label.setStyleSheet(
-            f"background-color: {COLORS['bg_light']}; "
-            f"border: 1px solid {COLORS['border']}; "
-            f"border-radius: 6px; padding: 10px; font-size: 12px;"
-        )
+        self._path_label.setObjectName("pathBox")
         self._path_label.setWordWrap(True)
         lay.addWidget(self._path_label)
 
@@ -140,19 +135,14 @@ class FirstRunDialog(QDialog):
         )
         desc.setAlignment(Qt.AlignCenter)
         desc.setWordWrap(True)
-        desc.setStyleSheet(f"color: {COLORS['text_dim']}; font-size: 13px;")
+        desc.setObjectName("firstRunDesc")
         lay.addWidget(desc)
 
         lay.addSpacing(6)
 
         ext_label = QLabel("📷  .jpg   .jpeg   .png")
         ext_label.setAlignment(Qt.AlignCenter)
-        ext_label.setStyleSheet(
-            f"background-color: {COLORS['bg_light']}; "
-            f"border: 1px solid {COLORS['border']}; "
-            f"border-radius: 6px; padding: 14px; font-size: 14px; "
-            f"font-weight: 600; letter-spacing: 2px;"
-        )
+        ext_label.setObjectName("extBox")
         lay.addWidget(ext_label)
 
         lay.addStretch()
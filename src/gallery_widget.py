@@ -8,17 +8,22 @@ checkmarks.
 
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, QSize, QRect, Signal
+from typing import Iterable
+
+from PySide6.QtCore import Qt, QPointF, QSize, QRect, QTimer, Signal
 from PySide6.QtGui import (
     QBrush,
     QColor,
     QFont,
-    QIcon,
+    QFontMetrics,
     QImage,
     QPainter,
-    QPainterPath,
     QPen,
     QPixmap,
+    QPixmapCache,
+    QPolygonF,
+    QStaticText,
+    QTransform,
 )
 from PySide6.QtWidgets import (
     QApplication,
@@ -36,13 +41,152 @@ ITEM_SIZE = QSize(ITEM_W, ITEM_H)
 
 # Custom data roles
 ROLE_PATH = Qt.ItemDataRole.UserRole + 1
-ROLE_MEDIA_TYPE = Qt.ItemDataRole.UserRole + 2
-ROLE_LOADED = Qt.ItemDataRole.UserRole + 3
-ROLE_APP_SELECTED = Qt.ItemDataRole.UserRole + 4
-ROLE_DATE_HEADER = Qt.ItemDataRole.UserRole + 5
-ROLE_SELECTION_ORDER = Qt.ItemDataRole.UserRole + 6  # 1-based order number
+ROLE_DATE_HEADER = Qt.ItemDataRole.UserRole + 2
+ROLE_STATE = Qt.ItemDataRole.UserRole + 3  # _ItemState read by the delegate
 
 DATE_HEADER_H = 44
+THUMB_RADIUS = 8.0
+NAME_TEXT_W = ITEM_W - 12
+PIXMAP_CACHE_KB = 128 * 1024  # room for ~1000 rounded thumbnails
+
+# Paint colors, parsed once
+_COL_WHITE = QColor("#ffffff")
+_COL_PLACEHOLDER_BG = QColor("#1c1c2e")
+_COL_PLACEHOLDER_ICON = QColor("#2a2a44")
+_COL_PLACEHOLDER_GLYPH = QColor("#3d3d5c")
+_COL_VIDEO_BADGE = QColor(0, 0, 0, 170)
+_COL_ORDER_BADGE = QColor("#7c5cfc")
+_COL_HOVER = QColor("#262640")
+_COL_SEL_BG = QColor("#1e1e36")
+_COL_SEP = QColor("#2a2a3e")
+_COL_HDR_TEXT = QColor("#8686a4")
+_COL_TEXT = QColor("#b8b8d0")
+
+_name_metrics: QFontMetrics | None = None
+_PLACEHOLDER: QPixmap | None = None
+
+
+def _elide_name(name: str) -> str:
+    """Elide *name* to the filename line of a cell (font metrics built lazily)."""
+    global _name_metrics
+    if _name_metrics is None:
+        _name_metrics = QFontMetrics(QFont("Segoe UI", 9))
+    return _name_metrics.elidedText(name, Qt.TextElideMode.ElideMiddle, NAME_TEXT_W)
+
+
+def _round_corners(pm: QPixmap, radius: float = THUMB_RADIUS) -> QPixmap:
+    """Return a copy of *pm* with transparent rounded corners baked in."""
+    out = QPixmap(pm.size())
+    out.fill(Qt.GlobalColor.transparent)
+    p = QPainter(out)
+    p.setRenderHint(QPainter.RenderHint.Antialiasing)
+    p.setPen(Qt.PenStyle.NoPen)
+    p.setBrush(QBrush(_COL_WHITE))
+    p.drawRoundedRect(0, 0, pm.width(), pm.height(), radius, radius)
+    p.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
+    p.drawPixmap(0, 0, pm)
+    p.end()
+    return out
+
+
+def _placeholder() -> QPixmap:
+    """Return the shared, pre-rounded thumbnail placeholder (built once)."""
+    global _PLACEHOLDER
+    if _PLACEHOLDER is None:
+        pm = QPixmap(THUMB_SIZE, THUMB_SIZE)
+        pm.fill(_COL_PLACEHOLDER_BG)
+        p = QPainter(pm)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        p.setPen(Qt.PenStyle.NoPen)
+        # Subtle icon
+        p.setBrush(QBrush(_COL_PLACEHOLDER_ICON))
+        p.drawRoundedRect(40, 40, 100, 100, 16, 16)
+        p.setPen(_COL_PLACEHOLDER_GLYPH)
+        p.setFont(QFont("Segoe UI", 28))
+        p.drawText(QRect(40, 40, 100, 100), Qt.AlignmentFlag.AlignCenter, "🖼")
+        p.end()
+        _PLACEHOLDER = _round_corners(pm)
+    return _PLACEHOLDER
+
+
+# Play glyph around the badge centre
+_PLAY_TRIANGLE = QPolygonF([QPointF(-4, -6), QPointF(6, 0), QPointF(-4, 6)])
+
+
+def _video_badge() -> QPixmap:
+    """Return the shared play badge drawn on video thumbnails."""
+    key = "ash:video_badge_30"
+    pm = QPixmap()
+    if QPixmapCache.find(key, pm):
+        return pm
+    bs = 30
+    pm = QPixmap(bs, bs)
+    pm.fill(Qt.GlobalColor.transparent)
+    p = QPainter(pm)
+    p.setRenderHint(QPainter.RenderHint.Antialiasing)
+    p.setPen(Qt.PenStyle.NoPen)
+    p.setBrush(QBrush(_COL_VIDEO_BADGE))
+    p.drawRoundedRect(0, 0, bs, bs, 6.0, 6.0)
+    # play triangle
+    p.setBrush(QBrush(_COL_WHITE))
+    p.translate(bs / 2, bs / 2)
+    p.drawPolygon(_PLAY_TRIANGLE)
+    p.end()
+    QPixmapCache.insert(key, pm)
+    return pm
+
+
+def _order_badge(order_num: int) -> QPixmap:
+    """Return the purple selection-order pill for *order_num*."""
+    num_str = str(order_num)
+    key = f"ash:sel_badge:{num_str}"
+    pm = QPixmap()
+    if QPixmapCache.find(key, pm):
+        return pm
+    # Dynamic badge size based on number of digits
+    base_size = 24
+    badge_w = base_size + max(0, (len(num_str) - 1) * 8)
+    badge_h = base_size
+    pm = QPixmap(badge_w, badge_h)
+    pm.fill(Qt.GlobalColor.transparent)
+    p = QPainter(pm)
+    p.setRenderHint(QPainter.RenderHint.Antialiasing)
+    p.setPen(Qt.PenStyle.NoPen)
+    p.setBrush(QBrush(_COL_ORDER_BADGE))
+    p.drawRoundedRect(0, 0, badge_w, badge_h, 12.0, 12.0)
+    p.setPen(_COL_WHITE)
+    p.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
+    p.drawText(QRect(0, 0, badge_w, badge_h), Qt.AlignmentFlag.AlignCenter, num_str)
+    p.end()
+    QPixmapCache.insert(key, pm)
+    return pm
+
+
+class _ItemState:
+    """Everything the delegate paints for one cell, fetched in one data() call.
+
+    Mutated in place by GalleryWidget, which then repaints the cell itself.
+    """
+
+    __slots__ = ("header", "elided", "is_video", "thumb", "selected", "order", "text")
+
+    def __init__(self, header: str | None = None, elided: str = "",
+                 is_video: bool = False):
+        self.header = header                  # date text for header rows
+        self.elided = elided                  # file name elided to the cell width
+        self.is_video = is_video
+        self.thumb: QPixmap | None = None     # fitted to THUMB_SIZE, corners rounded
+        self.selected = False
+        self.order = 0                        # 1-based selection order
+        self.text: QStaticText | None = None  # laid-out header/name, built on first paint
+
+
+def _static_text(text: str, font: QFont) -> QStaticText:
+    """Lay out *text* once so repaints skip shaping."""
+    st = QStaticText(text)
+    st.setTextFormat(Qt.TextFormat.PlainText)
+    st.prepare(QTransform(), font)
+    return st
 
 
 # ────────────────────────────────────────────────────────────────
@@ -54,44 +198,59 @@ class ThumbnailDelegate(QStyledItemDelegate):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._placeholder = self._make_placeholder()
+        self._placeholder = _placeholder()
+        self._bg_hover = self._make_card(_COL_HOVER)
+        self._bg_selected = self._make_card(_COL_SEL_BG)
+
+        # Paint resources reused on every call
+        self._pen_sep = QPen(_COL_SEP, 1)
+        self._pen_header = QPen(_COL_HDR_TEXT)
+        self._font_header = QFont("Segoe UI", 11, QFont.Weight.DemiBold)
+        self._pen_name = QPen(_COL_TEXT)
+        self._font_name = QFont("Segoe UI", 9)
 
     @staticmethod
-    def _make_placeholder() -> QPixmap:
-        pm = QPixmap(THUMB_SIZE, THUMB_SIZE)
-        pm.fill(QColor("#1c1c2e"))
+    def _make_card(color: QColor) -> QPixmap:
+        """Pre-render the rounded hover/selection card for a standard cell."""
+        pm = QPixmap(ITEM_W - 6, ITEM_H - 6)
+        pm.fill(Qt.GlobalColor.transparent)
         p = QPainter(pm)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
         p.setPen(Qt.PenStyle.NoPen)
-        # Subtle icon
-        p.setBrush(QBrush(QColor("#2a2a44")))
-        p.drawRoundedRect(40, 40, 100, 100, 16, 16)
-        p.setPen(QColor("#3d3d5c"))
-        p.setFont(QFont("Segoe UI", 28))
-        p.drawText(QRect(40, 40, 100, 100), Qt.AlignmentFlag.AlignCenter, "🖼")
+        p.setBrush(QBrush(color))
+        p.drawRoundedRect(0, 0, pm.width(), pm.height(), 10.0, 10.0)
         p.end()
         return pm
 
     # ---- painting ----
 
     def paint(self, painter: QPainter, option, index):
+        # Qt may still hand us neighbours of a partial viewport update
+        if painter.hasClipping() and not option.rect.intersects(
+            painter.clipBoundingRect().toAlignedRect()
+        ):
+            return
+
+        st: _ItemState | None = index.data(ROLE_STATE)
+        if st is None:
+            return
+
         # ── Date header item ──
-        if index.data(ROLE_DATE_HEADER):
+        if st.header is not None:
             painter.save()
             painter.setRenderHint(QPainter.RenderHint.Antialiasing)
             rect: QRect = option.rect
             # Separator line
-            painter.setPen(QPen(QColor("#2a2a3e"), 1))
+            painter.setPen(self._pen_sep)
             painter.drawLine(rect.x() + 16, rect.bottom() - 1,
                              rect.right() - 16, rect.bottom() - 1)
             # Date text
-            painter.setPen(QColor("#8686a4"))
-            painter.setFont(QFont("Segoe UI", 11, QFont.Weight.DemiBold))
-            painter.drawText(
-                QRect(rect.x() + 16, rect.y(), rect.width() - 32, rect.height() - 4),
-                Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft,
-                index.data(Qt.ItemDataRole.DisplayRole) or "",
-            )
+            painter.setPen(self._pen_header)
+            painter.setFont(self._font_header)
+            if st.text is None:
+                st.text = _static_text(st.header, self._font_header)
+            ty = rect.y() + (rect.height() - 4 - st.text.size().height()) / 2
+            painter.drawStaticText(QPointF(rect.x() + 16, ty), st.text)
             painter.restore()
             return
 
@@ -102,112 +261,55 @@ class ThumbnailDelegate(QStyledItemDelegate):
 
         rect: QRect = option.rect
         hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
-        app_sel = bool(index.data(ROLE_APP_SELECTED))
-        media_type: str = index.data(ROLE_MEDIA_TYPE) or ""
+        app_sel = st.selected
 
         # --- card background on hover / selection ---
         if hovered or app_sel:
-            bg = QColor("#262640") if hovered else QColor("#1e1e36")
-            card = QPainterPath()
-            card.addRoundedRect(
-                float(rect.x() + 3), float(rect.y() + 3),
-                float(rect.width() - 6), float(rect.height() - 6),
-                10.0, 10.0,
-            )
-            painter.fillPath(card, QBrush(bg))
+            card = self._bg_hover if hovered else self._bg_selected
+            if rect.width() == ITEM_W and rect.height() == ITEM_H:
+                painter.drawPixmap(rect.x() + 3, rect.y() + 3, card)
+            else:
+                painter.drawPixmap(rect.adjusted(3, 3, -3, -3), card)
 
         # --- thumbnail area ---
         tx = rect.x() + (rect.width() - THUMB_SIZE) // 2
         ty = rect.y() + 10
         thumb_rect = QRect(tx, ty, THUMB_SIZE, THUMB_SIZE)
 
-        # Get pixmap
-        icon = index.data(Qt.ItemDataRole.DecorationRole)
-        if isinstance(icon, QIcon) and not icon.isNull():
-            pm = icon.pixmap(THUMB_SIZE, THUMB_SIZE)
-        else:
-            pm = self._placeholder
-
-        if not pm.isNull():
-            scaled = pm.scaled(
-                THUMB_SIZE, THUMB_SIZE,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-            dx = tx + (THUMB_SIZE - scaled.width()) // 2
-            dy = ty + (THUMB_SIZE - scaled.height()) // 2
-
-            clip = QPainterPath()
-            clip.addRoundedRect(
-                float(dx), float(dy),
-                float(scaled.width()), float(scaled.height()),
-                8.0, 8.0,
-            )
-            painter.setClipPath(clip)
-            painter.drawPixmap(dx, dy, scaled)
-            painter.setClipping(False)
+        # Get pixmap (fitted and rounded once by set_thumbnail*)
+        thumb = st.thumb
+        if thumb is None or thumb.isNull():
+            thumb = self._placeholder
+
+        if not thumb.isNull():
+            dx = tx + (THUMB_SIZE - thumb.width()) // 2
+            dy = ty + (THUMB_SIZE - thumb.height()) // 2
+            painter.drawPixmap(dx, dy, thumb)
 
         # --- video badge ---
-        if media_type == "video":
-            bs = 30
-            bx = thumb_rect.right() - bs - 6
-            by = thumb_rect.bottom() - bs - 6
-            badge = QPainterPath()
-            badge.addRoundedRect(float(bx), float(by), float(bs), float(bs), 6.0, 6.0)
-            painter.fillPath(badge, QBrush(QColor(0, 0, 0, 170)))
-            # play triangle
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(QBrush(QColor("#ffffff")))
-            tri = QPainterPath()
-            cx, cy = bx + bs / 2, by + bs / 2
-            tri.moveTo(cx - 4, cy - 6)
-            tri.lineTo(cx + 6, cy)
-            tri.lineTo(cx - 4, cy + 6)
-            tri.closeSubpath()
-            painter.drawPath(tri)
+        if st.is_video:
+            badge = _video_badge()
+            bx = thumb_rect.right() - badge.width() - 6
+            by = thumb_rect.bottom() - badge.height() - 6
+            painter.drawPixmap(bx, by, badge)
 
         # --- selection order number badge ---
         if app_sel:
-            order_num = index.data(ROLE_SELECTION_ORDER) or 0
-            # Dynamic badge size based on number of digits
-            num_str = str(order_num)
-            base_size = 24
-            extra_width = max(0, (len(num_str) - 1) * 8)
-            badge_w = base_size + extra_width
-            badge_h = base_size
-            cxp = thumb_rect.right() - badge_w + 4
+            badge = _order_badge(st.order)
+            cxp = thumb_rect.right() - badge.width() + 4
             cyp = thumb_rect.y() - 2
-            badge = QPainterPath()
-            badge.addRoundedRect(float(cxp), float(cyp), float(badge_w), float(badge_h), 12.0, 12.0)
-            painter.fillPath(badge, QBrush(QColor("#7c5cfc")))
-            # Draw the selection order number
-            painter.setPen(QColor("#ffffff"))
-            painter.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-            painter.drawText(
-                QRect(int(cxp), int(cyp), int(badge_w), int(badge_h)),
-                Qt.AlignmentFlag.AlignCenter,
-                num_str,
-            )
+            painter.drawPixmap(cxp, cyp, badge)
 
         # --- filename text ---
-        text_rect = QRect(rect.x() + 6, thumb_rect.bottom() + 4, rect.width() - 12, 28)
-        painter.setPen(QColor("#b8b8d0"))
-        painter.setFont(QFont("Segoe UI", 9))
-        raw = index.data(Qt.ItemDataRole.DisplayRole) or ""
-        elided = painter.fontMetrics().elidedText(
-            raw, Qt.TextElideMode.ElideMiddle, text_rect.width()
-        )
-        painter.drawText(text_rect, Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop, elided)
+        if st.text is None:
+            st.text = _static_text(st.elided, self._font_name)
+        painter.setPen(self._pen_name)
+        painter.setFont(self._font_name)
+        nx = rect.x() + (rect.width() - st.text.size().width()) / 2
+        painter.drawStaticText(QPointF(nx, thumb_rect.bottom() + 4), st.text)
 
         painter.restore()
 
-    def sizeHint(self, option, index):
-        if index.data(ROLE_DATE_HEADER):
-            parent = self.parent()
-            vw = parent.viewport().width() if parent else 1200
-            return QSize(vw, DATE_HEADER_H)
-        return ITEM_SIZE
-
 
 # ────────────────────────────────────────────────────────────────
 #  Gallery list widget
@@ -233,10 +335,19 @@ class GalleryWidget(QListWidget):
         self.setVerticalScrollMode(QListWidget.ScrollMode.ScrollPerPixel)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
 
+        if QPixmapCache.cacheLimit() < PIXMAP_CACHE_KB:
+            QPixmapCache.setCacheLimit(PIXMAP_CACHE_KB)
+
         self._delegate = ThumbnailDelegate(self)
         self.setItemDelegate(self._delegate)
 
         self._path_items: dict[str, QListWidgetItem] = {}
+        self._states: dict[str, _ItemState] = {}  # path -> paint state
+        self._path_pos: dict[str, int] | None = None  # path -> position, built on demand
+        self._header_items: list[QListWidgetItem] = []
+        self._header_w = 0
+        self._selected: dict[str, None] = {}  # ordered set of selected paths
+        self._update_pending = False
 
         self.itemClicked.connect(self._on_click)
 
@@ -247,92 +358,200 @@ class GalleryWidget(QListWidget):
         item = QListWidgetItem()
         item.setData(Qt.ItemDataRole.DisplayRole, date_str)
         item.setData(ROLE_DATE_HEADER, True)
+        item.setData(ROLE_STATE, _ItemState(header=date_str))
         item.setFlags(Qt.ItemFlag.NoItemFlags)  # not selectable/clickable
-        # Do NOT call setSizeHint — the delegate computes it dynamically
+        # Full viewport width; kept in sync by resizeEvent
+        item.setSizeHint(QSize(self._header_width(), DATE_HEADER_H))
         self.addItem(item)
+        self._header_items.append(item)
 
     def add_media_item(self, name: str, path: str, media_type: str):
+        self.addItem(self._make_media_item(name, path, media_type))
+
+    def add_media_items_bulk(self, entries: Iterable[tuple[str, str, str]]):
+        """Append many ``(name, path, media_type)`` entries with one repaint."""
+        items = [self._make_media_item(*e) for e in entries]
+        if not items:
+            return
+        self.setUpdatesEnabled(False)
+        try:
+            for item in items:
+                self.addItem(item)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _make_media_item(self, name: str, path: str, media_type: str) -> QListWidgetItem:
         item = QListWidgetItem()
         item.setData(Qt.ItemDataRole.DisplayRole, name)
         item.setData(ROLE_PATH, path)
-        item.setData(ROLE_MEDIA_TYPE, media_type)
-        item.setData(ROLE_LOADED, False)
-        item.setData(ROLE_APP_SELECTED, False)
-        item.setData(ROLE_SELECTION_ORDER, 0)
+        st = _ItemState(elided=_elide_name(name), is_video=media_type == "video")
+        item.setData(ROLE_STATE, st)
         item.setSizeHint(ITEM_SIZE)
-        self.addItem(item)
         self._path_items[path] = item
+        self._states[path] = st
+        self._path_pos = None
+        return item
 
     def set_thumbnail(self, path: str, qimage: QImage):
-        item = self._path_items.get(path)
-        if item:
-            item.setIcon(QIcon(QPixmap.fromImage(qimage)))
-            item.setData(ROLE_LOADED, True)
+        """Show *qimage* for *path*.
+
+        Callers should deliver images already fitted to THUMB_SIZE (as
+        ThumbnailWorker does) so no resampling happens on the GUI thread.
+        """
+        self.set_thumbnail_pixmap(path, QPixmap.fromImage(qimage))
 
     def set_thumbnail_pixmap(self, path: str, pm: QPixmap):
         item = self._path_items.get(path)
         if item:
-            item.setIcon(QIcon(pm))
-            item.setData(ROLE_LOADED, True)
+            self._states[path].thumb = self._rounded_thumb(pm)
+            self.update(self.indexFromItem(item))
+
+    def set_thumbnails_batch(self, pixmaps: dict[str, QPixmap]):
+        """Apply many thumbnails with a single viewport repaint.
+
+        Paths not in this gallery are skipped.
+        """
+        states = self._states
+        changed = False
+        for path, pm in pixmaps.items():
+            st = states.get(path)
+            if st is not None:
+                st.thumb = self._rounded_thumb(pm)
+                changed = True
+        if changed:
+            self._schedule_update()
+
+    @classmethod
+    def _rounded_thumb(cls, pm: QPixmap) -> QPixmap:
+        """Fit and round *pm*, shared through QPixmapCache.
+
+        Keyed by the source pixmap's cacheKey, so the three galleries and
+        every repopulate reuse one rounded copy, and a regenerated
+        thumbnail (a new source pixmap) never hits a stale entry.
+        """
+        key = f"ash:thumb:{pm.cacheKey()}"
+        rounded = QPixmap()
+        if QPixmapCache.find(key, rounded):
+            return rounded
+        rounded = _round_corners(cls._fit_thumb(pm))
+        QPixmapCache.insert(key, rounded)
+        return rounded
+
+    @staticmethod
+    def _fit_thumb(pm: QPixmap) -> QPixmap:
+        """Scale *pm* to fit THUMB_SIZE once, so the delegate only blits.
+
+        Worker thumbnails already match, so this is normally a no-op.
+        """
+        if max(pm.width(), pm.height()) == THUMB_SIZE:
+            return pm
+        return pm.scaled(
+            THUMB_SIZE, THUMB_SIZE,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
 
     def toggle_selection(self, path: str) -> bool:
         item = self._path_items.get(path)
         if item:
-            cur = bool(item.data(ROLE_APP_SELECTED))
-            item.setData(ROLE_APP_SELECTED, not cur)
-            if cur:  # Was selected, now deselecting - clear order
-                item.setData(ROLE_SELECTION_ORDER, 0)
-            self.viewport().update()
-            return not cur
+            st = self._states[path]
+            st.selected = not st.selected
+            if st.selected:
+                self._selected[path] = None
+            else:  # Deselecting - clear order
+                st.order = 0
+                del self._selected[path]
+            self.update(self.indexFromItem(item))
+            return st.selected
         return False
 
     def set_selection(self, path: str, selected: bool, order: int = 0):
         item = self._path_items.get(path)
         if item:
-            item.setData(ROLE_APP_SELECTED, selected)
-            item.setData(ROLE_SELECTION_ORDER, order if selected else 0)
-            self.viewport().update()
+            st = self._states[path]
+            st.selected = selected
+            st.order = order if selected else 0
+            if selected:
+                self._selected[path] = None
+            else:
+                self._selected.pop(path, None)
+            self.update(self.indexFromItem(item))
 
     def set_selection_order(self, path: str, order: int):
         """Update just the selection order for a path."""
         item = self._path_items.get(path)
         if item:
-            item.setData(ROLE_SELECTION_ORDER, order)
-            self.viewport().update()
+            self._states[path].order = order
+            self.update(self.indexFromItem(item))
 
     def update_all_selection_orders(self, ordered_paths: list[str]):
         """Update selection order for all items based on the ordered list."""
-        for path, item in self._path_items.items():
-            if path in ordered_paths:
-                order = ordered_paths.index(path) + 1  # 1-based
-                item.setData(ROLE_APP_SELECTED, True)
-                item.setData(ROLE_SELECTION_ORDER, order)
-            else:
-                item.setData(ROLE_APP_SELECTED, False)
-                item.setData(ROLE_SELECTION_ORDER, 0)
-        self.viewport().update()
+        orders = {path: n for n, path in enumerate(ordered_paths, 1)}  # 1-based
+        # Only previously selected items can need clearing
+        for path in [p for p in self._selected if p not in orders]:
+            del self._selected[path]
+            st = self._states.get(path)
+            if st:
+                st.selected = False
+                st.order = 0
+        for path, order in orders.items():
+            st = self._states.get(path)
+            if st:
+                st.selected = True
+                st.order = order
+                self._selected[path] = None
+        self._schedule_update()
 
     def get_selected_paths(self) -> list[str]:
-        return [
-            self.item(i).data(ROLE_PATH)
-            for i in range(self.count())
-            if self.item(i).data(ROLE_APP_SELECTED)
-        ]
+        """Return selected paths in the order they were selected."""
+        return list(self._selected)
 
     def clear_all_selection(self):
-        for i in range(self.count()):
-            self.item(i).setData(ROLE_APP_SELECTED, False)
-            self.item(i).setData(ROLE_SELECTION_ORDER, 0)
-        self.viewport().update()
+        for path in self._selected:
+            st = self._states.get(path)
+            if st:
+                st.selected = False
+                st.order = 0
+        self._selected.clear()
+        self._schedule_update()
 
     def remove_by_path(self, path: str):
+        self._path_pos = None
         item = self._path_items.pop(path, None)
+        self._states.pop(path, None)
+        self._selected.pop(path, None)
         if item:
-            self.takeItem(self.row(item))
+            self.takeItem(self.indexFromItem(item).row())
+
+    def remove_paths(self, paths: Iterable[str]):
+        """Remove many paths at once, with a single repaint."""
+        self._path_pos = None
+        rows = []
+        for path in paths:
+            item = self._path_items.pop(path, None)
+            self._states.pop(path, None)
+            self._selected.pop(path, None)
+            if item:
+                # Rows are resolved before any removal, while each item's
+                # cached row hint is still valid
+                rows.append(self.indexFromItem(item).row())
+        if not rows:
+            return
+        rows.sort(reverse=True)
+        self.setUpdatesEnabled(False)
+        try:
+            for row in rows:
+                self.takeItem(row)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def clear_gallery(self):
         self.clear()
         self._path_items.clear()
+        self._states.clear()
+        self._path_pos = None
+        self._header_items.clear()
+        self._selected.clear()
 
     def visible_paths(self) -> list[str]:
         """Return media paths currently visible in the viewport."""
@@ -354,14 +573,41 @@ class GalleryWidget(QListWidget):
         return paths
 
     def get_all_paths(self) -> list[str]:
-        return [
-            p for i in range(self.count())
-            if (p := self.item(i).data(ROLE_PATH))
-        ]
+        """Return media paths in display order (headers are never indexed)."""
+        return list(self._path_items.keys())
 
     def path_exists(self, path: str) -> bool:
         return path in self._path_items
 
+    def index_of(self, path: str) -> int:
+        """Return the position of *path* in get_all_paths(), or -1."""
+        if self._path_pos is None:
+            self._path_pos = {p: i for i, p in enumerate(self._path_items)}
+        return self._path_pos.get(path, -1)
+
+    def _schedule_update(self):
+        """Coalesce bulk repaint requests into one viewport update per event loop pass."""
+        if self._update_pending:
+            return
+        self._update_pending = True
+        QTimer.singleShot(0, self._do_update)
+
+    def _do_update(self):
+        self._update_pending = False
+        self.viewport().update()
+
+    def _header_width(self) -> int:
+        self._header_w = self.viewport().width()
+        return self._header_w
+
+    def resizeEvent(self, event):
+        # Also receives viewport resizes (e.g. the scrollbar appearing)
+        if self._header_items and self.viewport().width() != self._header_w:
+            hint = QSize(self._header_width(), DATE_HEADER_H)
+            for item in self._header_items:
+                item.setSizeHint(hint)
+        super().resizeEvent(event)
+
     def _lock_horizontal_scroll(self):
         bar = self.horizontalScrollBar()
         if bar.value() != 0:
@@ -9,17 +9,23 @@ scanning automatically appears in the FOLDERS tab sidebar.
 
 from __future__ import annotations
 
+import bisect
+import heapq
 import os
 import platform
+import time
 from collections import OrderedDict
-from datetime import datetime, timedelta
-from functools import partial
+from datetime import date
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
+from typing import Iterable
 
 from PySide6.QtCore import Qt, QTimer, QPoint, QSize
 from PySide6.QtGui import QColor, QFont, QPixmap, QImage, QIcon
 from PySide6.QtWidgets import (
     QApplication,
+    QButtonGroup,
     QComboBox,
     QFileDialog,
     QFrame,
@@ -57,12 +63,13 @@ from .default_app import (
 from .gallery_widget import GalleryWidget
 from .media_ops import MediaOperations, copy_files_to_clipboard, rotate_image_clockwise_90
 from .models import MediaItem
-from .scanner import ScannerWorker
+from .scanner import HiddenScanWorker, ScannerWorker
 from .theme import COLORS
 from .thumb_loader import ThumbnailWorker
 from .viewer_window import ViewerWindow
 
 RECENT_DAYS = 30
+THUMB_CACHE_MAX = 2048  # decoded thumbnails kept for repopulating galleries
 BASE_DIR = Path(__file__).resolve().parents[1]
 
 # Tab identifiers
@@ -78,6 +85,46 @@ TAB_HIDDEN = "HIDDEN"
 TAB_ORDER = [TAB_ALL, TAB_PHOTOS, TAB_VIDEOS, TAB_RECENT,
              TAB_SCREENSHOTS, TAB_FOLDERS, TAB_PDF_PNG, TAB_HIDDEN]
 
+# sort key → (key function, reverse); keys match config.SORT_OPTIONS
+_SORT_SPECS = {
+    "name_asc": (attrgetter("name_lower"), False),
+    "name_desc": (attrgetter("name_lower"), True),
+    "created_desc": (attrgetter("created"), True),
+    "created_asc": (attrgetter("created"), False),
+    "modified_desc": (attrgetter("modified"), True),
+    "modified_asc": (attrgetter("modified"), False),
+    "size_asc": (attrgetter("size"), False),
+    "size_desc": (attrgetter("size"), True),
+}
+_SORTED_CACHE_MAX = 32
+
+# Tabs whose contents are bucketed from the scanned items as they arrive
+BUCKET_TABS = (TAB_ALL, TAB_PHOTOS, TAB_VIDEOS, TAB_RECENT, TAB_SCREENSHOTS)
+# MediaItem.tab_mask bit per bucketed tab
+_TAB_BIT = {tab: 1 << n for n, tab in enumerate(BUCKET_TABS)}
+
+
+def _fill_list(widget: QListWidget, entries: Iterable[tuple[str, str]]):
+    """Replace *widget*'s rows with ``(text, UserRole data)`` entries.
+
+    Signals and repaints are held off until every row is in, so the
+    refill costs one layout instead of one per row.
+    """
+    items = []
+    for text, data in entries:
+        li = QListWidgetItem(text)
+        li.setData(Qt.ItemDataRole.UserRole, data)
+        items.append(li)
+    widget.setUpdatesEnabled(False)
+    blocked = widget.blockSignals(True)
+    try:
+        widget.clear()
+        for li in items:
+            widget.addItem(li)
+    finally:
+        widget.blockSignals(blocked)
+        widget.setUpdatesEnabled(True)
+
 
 class _TipPopup(QFrame):
     def __init__(self, parent=None):
@@ -156,14 +203,36 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(960, 640)
 
         # ---- data stores ----
-        self._all_items: list[MediaItem] = []
+        # The scanned library, path → item in arrival order
+        self._items_by_path: dict[str, MediaItem] = {}
+        # Items pre-classified per tab / per folder_path, keyed by path so a
+        # removal is a dict pop
+        self._tab_items: dict[str, dict[str, MediaItem]] = {t: {} for t in BUCKET_TABS}
+        self._folder_items: dict[str, dict[str, MediaItem]] = {}
+        # modified-time threshold for TAB_RECENT, advanced once a minute
+        self._recent_cutoff = time.time() - RECENT_DAYS * 86400
+        self._recent_timer = QTimer(self)
+        self._recent_timer.timeout.connect(self._refresh_recent_cutoff)
+        self._recent_timer.start(60_000)
+        # (tab or folder_path, sort key) → sorted bucket; cleared on any mutation
+        self._sorted_cache: dict[tuple[str, str], list[MediaItem]] = {}
+        # Normalised "<folder><sep>" prefixes for the screenshot test
+        self._screenshot_roots = tuple(
+            os.path.join(os.path.normcase(str(sf)).rstrip("\\/"), "")
+            for sf in SCREENSHOT_FOLDERS
+        )
         self._selected_paths: list[str] = []  # Ordered list to preserve selection order
-        self._thumb_cache: dict[str, QPixmap] = {}  # path → QPixmap
+        # path → QPixmap, least recently used first; see _cache_thumb
+        self._thumb_cache: OrderedDict[str, QPixmap] = OrderedDict()
+        self._thumb_evicted: set[str] = set()  # dropped paths to regenerate on demand
         self._current_tab: str = TAB_ALL
         self._current_sort: str = "modified_desc"
 
         # Folder tracking: folder_path → display_name
-        self._discovered_folders: OrderedDict[str, str] = OrderedDict()
+        self._discovered_folders: dict[str, str] = {}
+        # The same folders as (lower display_name, folder_path), kept sorted
+        self._discovered_folders_sorted: list[tuple[str, str]] = []
+        self._folder_sidebar_dirty = True  # folders or their counts changed
         self._active_folder: str | None = None  # for FOLDERS tab
 
         # PDF→PNG data
@@ -175,6 +244,20 @@ class MainWindow(QMainWindow):
         self._thumb_prioritize_timer = QTimer(self)
         self._thumb_prioritize_timer.setSingleShot(True)
         self._thumb_prioritize_timer.timeout.connect(self._prioritize_visible_thumbnails)
+        # Scanner batches are shown/queued together once per flush interval
+        self._pending_items: list[MediaItem] = []
+        self._pending_flush_timer = QTimer(self)
+        self._pending_flush_timer.setSingleShot(True)
+        self._pending_flush_timer.timeout.connect(self._flush_pending_items)
+        # Finished thumbnails are likewise applied in 50 ms batches
+        self._pending_thumbs: dict[str, QPixmap] = {}
+        self._thumb_flush_timer = QTimer(self)
+        self._thumb_flush_timer.setSingleShot(True)
+        self._thumb_flush_timer.timeout.connect(self._flush_pending_thumbs)
+        # HIDDEN tab contents, listed off-thread and reused while the
+        # hidden folder's mtime is unchanged
+        self._hidden_worker: HiddenScanWorker | None = None
+        self._hidden_cache: tuple[int, list[MediaItem]] | None = None
 
         # ---- active viewer (for confirm_removal callbacks) ----
         self._active_viewer: ViewerWindow | None = None
@@ -477,12 +560,16 @@ class MainWindow(QMainWindow):
         lay.setSpacing(2)
 
         self._tab_btns: dict[str, QPushButton] = {}
-        for tab_id in TAB_ORDER:
+        # One exclusive group routes every tab by its TAB_ORDER index
+        self._tab_group = QButtonGroup(self)
+        self._tab_group.setExclusive(True)
+        self._tab_group.idClicked.connect(self._on_tab_id_clicked)
+        for n, tab_id in enumerate(TAB_ORDER):
             btn = QPushButton(tab_id)
             btn.setObjectName("tabBtn")
             btn.setCheckable(True)
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.clicked.connect(partial(self._on_tab_clicked, tab_id))
+            self._tab_group.addButton(btn, n)
             lay.addWidget(btn)
             self._tab_btns[tab_id] = btn
 
@@ -693,56 +780,127 @@ class MainWindow(QMainWindow):
         self._progress.show()
         self._status_label.setText("Scanning…")
 
+        if self._thumb_worker is None:
+            self._thumb_worker = ThumbnailWorker(self.cfg.cache_dir)
+            self._thumb_worker.thumbnails_ready.connect(self._on_thumbs_ready)
+            self._thumb_worker.start()
+        thumb_worker = self._thumb_worker
+
+        def enqueue_thumbs(batch: list[MediaItem]):
+            thumb_worker.enqueue_batch([i.path for i in batch])
+
         self._scanner = ScannerWorker(
             scan_folders=list(SCAN_FOLDERS),
             hidden_dir=self.cfg.hidden_dir,
         )
+        # Thumbnails are queued straight from the scanner thread
+        # (enqueue_batch is mutex-guarded), keeping that off the UI thread
+        self._scanner.items_found.connect(
+            enqueue_thumbs, Qt.ConnectionType.DirectConnection
+        )
         self._scanner.items_found.connect(self._on_items_found)
         self._scanner.scan_progress.connect(self._on_scan_progress)
         self._scanner.scan_finished.connect(self._on_scan_finished)
         self._scanner.start()
 
     def _on_items_found(self, batch: list[MediaItem]):
-        self._all_items.extend(batch)
+        self._ingest_items(batch)
+        self._pending_items.extend(batch)
+        if not self._pending_flush_timer.isActive():
+            self._pending_flush_timer.start(30)
+
+    def _flush_pending_items(self):
+        """Add the batches received since the last flush in one go."""
+        self._pending_flush_timer.stop()
+        batch, self._pending_items = self._pending_items, []
+        if not batch:
+            return
 
-        # Track folders
-        for item in batch:
-            fp = item.folder_path
-            if fp not in self._discovered_folders:
-                self._discovered_folders[fp] = item.folder
+        # If the current tab matches, add to gallery (unless a repopulate
+        # since ingestion already did)
+        added = [
+            item for item in batch
+            if self._item_matches_tab(item, self._current_tab)
+            and not self._gallery.path_exists(item.path)
+        ]
+        self._gallery.add_media_items_bulk(
+            (item.name, item.path, item.media_type) for item in added
+        )
+        # Thumbnails are queued by the scanner thread and may beat the flush
+        for item in added:
+            pm = self._thumb_cache.get(item.path)
+            if pm:
+                self._gallery.set_thumbnail_pixmap(item.path, pm)
+        self._schedule_thumb_prioritization()
 
-        # If the current tab matches, add to gallery immediately
-        for item in batch:
-            if self._item_matches_tab(item, self._current_tab):
-                self._gallery.add_media_item(item.name, item.path, item.media_type)
+    def _ingest_items(self, items: list[MediaItem]):
+        """Record new items and classify them into the tab/folder buckets once."""
+        self._items_by_path.update((i.path, i) for i in items)
+        self._folder_sidebar_dirty = True
+        tabs = self._tab_items
+        cutoff = self._recent_cutoff
+        for item in items:
+            path = item.path
+            mask = _TAB_BIT[TAB_ALL]
+            if item.media_type == "photo":
+                mask |= _TAB_BIT[TAB_PHOTOS]
+                if self._is_screenshot(item):
+                    mask |= _TAB_BIT[TAB_SCREENSHOTS]
+            elif item.media_type == "video":
+                mask |= _TAB_BIT[TAB_VIDEOS]
+            if item.modified >= cutoff:
+                mask |= _TAB_BIT[TAB_RECENT]
+            item.tab_mask = mask
+            for tab, bit in _TAB_BIT.items():
+                if mask & bit:
+                    tabs[tab][path] = item
 
-        # Queue thumbnails
-        if self._thumb_worker is None:
-            self._thumb_worker = ThumbnailWorker(self.cfg.cache_dir)
-            self._thumb_worker.thumbnail_ready.connect(self._on_thumb_ready)
-            self._thumb_worker.start()
-        self._thumb_worker.enqueue_batch([i.path for i in batch])
-        self._schedule_thumb_prioritization()
+            fp = item.folder_path
+            bucket = self._folder_items.get(fp)
+            if bucket is None:
+                self._folder_items[fp] = {path: item}
+                # Track folders
+                if fp not in self._discovered_folders:
+                    self._discovered_folders[fp] = item.folder
+                    bisect.insort(self._discovered_folders_sorted, (item.folder.lower(), fp))
+            else:
+                bucket[path] = item
+        self._merge_into_sorted_cache(items)
+
+    def _merge_into_sorted_cache(self, items: list[MediaItem]):
+        """Merge new *items* into every cached sorted bucket they belong to.
+
+        Only the new items are sorted; heapq.merge is stable, so the result
+        equals a full re-sort of the grown bucket.
+        """
+        for cache_key, sorted_items in self._sorted_cache.items():
+            scope, sort_key = cache_key
+            if scope in self._tab_items:
+                new = [i for i in items if self._item_matches_tab(i, scope)]
+            else:
+                new = [i for i in items if i.folder_path == scope]
+            if not new:
+                continue
+            spec = _SORT_SPECS.get(sort_key)
+            if spec is None:
+                self._sorted_cache[cache_key] = sorted_items + new
+                continue
+            key_fn, reverse = spec
+            new.sort(key=key_fn, reverse=reverse)
+            self._sorted_cache[cache_key] = list(
+                heapq.merge(sorted_items, new, key=key_fn, reverse=reverse)
+            )
 
     def _on_scan_progress(self, text: str):
         self._status_label.setText(text)
 
     def _on_scan_finished(self, total: int):
+        self._flush_pending_items()
         self._progress.hide()
         self._status_label.setText(f"{total} files found  •  {len(self._discovered_folders)} folders")
 
-        # Determine whether the screenshots tab should be visible
-        has_screenshots = any(
-            any(
-                item.folder_path.lower().rstrip("\\/ ") == str(sf).lower().rstrip("\\/ ")
-                for sf in SCREENSHOT_FOLDERS
-            )
-            for item in self._all_items
-        )
-        if has_screenshots:
-            self._tab_btns[TAB_SCREENSHOTS].show()
-        else:
-            self._tab_btns[TAB_SCREENSHOTS].hide()
+        # Show the screenshots tab only when it would have content
+        self._tab_btns[TAB_SCREENSHOTS].setVisible(bool(self._tab_items[TAB_SCREENSHOTS]))
 
         # Rebuild folder sidebar
         self._rebuild_folder_sidebar()
@@ -751,13 +909,47 @@ class MainWindow(QMainWindow):
         self._repopulate_gallery()
         self._schedule_thumb_prioritization()
 
-    def _on_thumb_ready(self, path: str, qimg: QImage):
-        pm = QPixmap.fromImage(qimg)
-        self._thumb_cache[path] = pm
-        # Update whichever gallery is visible
-        self._gallery.set_thumbnail_pixmap(path, pm)
-        self._hidden_gallery.set_thumbnail_pixmap(path, pm)
-        self._folder_gallery.set_thumbnail_pixmap(path, pm)
+    def _on_thumbs_ready(self, batch: list[tuple[str, QImage]]):
+        for path, qimg in batch:
+            # The worker already delivers RGB32, so this is a wrap, not a convert
+            pm = QPixmap.fromImage(qimg, Qt.ImageConversionFlag.NoFormatConversion)
+            self._cache_thumb(path, pm)
+            self._pending_thumbs[path] = pm
+        if not self._thumb_flush_timer.isActive():
+            self._thumb_flush_timer.start(50)
+
+    def _flush_pending_thumbs(self):
+        """Apply the thumbnails received since the last flush.
+
+        Only the visible gallery is updated; the others pick thumbnails
+        up from the cache when they are repopulated on show.
+        """
+        batch, self._pending_thumbs = self._pending_thumbs, {}
+        gallery = self._visible_gallery()
+        if gallery is not None and batch:
+            gallery.set_thumbnails_batch(batch)
+
+    def _cache_thumb(self, path: str, pm: QPixmap):
+        cache = self._thumb_cache
+        cache[path] = pm
+        cache.move_to_end(path)
+        self._thumb_evicted.discard(path)
+        while len(cache) > THUMB_CACHE_MAX:
+            old, _ = cache.popitem(last=False)
+            self._thumb_evicted.add(old)
+            if self._thumb_worker:
+                # Let the worker regenerate it (from its disk cache) on demand
+                self._thumb_worker.invalidate(old)
+
+    def _cached_thumb(self, path: str) -> QPixmap | None:
+        """Return the cached thumbnail for *path*, re-queueing it if evicted."""
+        pm = self._thumb_cache.get(path)
+        if pm is not None:
+            self._thumb_cache.move_to_end(path)
+        elif path in self._thumb_evicted and self._thumb_worker:
+            self._thumb_evicted.discard(path)
+            self._thumb_worker.enqueue(path)
+        return pm
 
     # ================================================================
     #  Folder sidebar
@@ -765,24 +957,20 @@ class MainWindow(QMainWindow):
 
     def _rebuild_folder_sidebar(self):
         """Populate the FOLDERS-tab sidebar with every discovered folder,
-        sorted alphabetically, with item counts."""
-        self._folder_list.clear()
+        sorted alphabetically, with item counts.
 
-        # Count files per folder
-        counts: dict[str, int] = {}
-        for item in self._all_items:
-            counts[item.folder_path] = counts.get(item.folder_path, 0) + 1
+        A no-op unless folders or their contents changed since last time.
+        """
+        if not self._folder_sidebar_dirty:
+            return
+        self._folder_sidebar_dirty = False
 
-        # Sort folders alphabetically by display name
-        sorted_folders = sorted(
-            self._discovered_folders.items(),
-            key=lambda kv: kv[1].lower(),
-        )
-        for folder_path, display_name in sorted_folders:
-            cnt = counts.get(folder_path, 0)
-            li = QListWidgetItem(f"{display_name}  ({cnt})")
-            li.setData(Qt.ItemDataRole.UserRole, folder_path)
-            self._folder_list.addItem(li)
+        # Already sorted alphabetically by display name as folders arrive
+        names = self._discovered_folders
+        _fill_list(self._folder_list, (
+            (f"{names[folder_path]}  ({len(self._folder_items.get(folder_path, ()))})", folder_path)
+            for _, folder_path in self._discovered_folders_sorted
+        ))
 
     def _on_folder_selected(self, current: QListWidgetItem | None, prev=None):
         if current is None:
@@ -794,11 +982,9 @@ class MainWindow(QMainWindow):
     def _repopulate_folder_gallery(self):
         if not self._active_folder:
             return
-        filtered = [
-            i for i in self._all_items
-            if i.folder_path == self._active_folder
-        ]
-        filtered = self._sort_items(filtered, self._current_sort)
+        filtered = self._sorted_bucket(
+            self._active_folder, self._folder_items.get(self._active_folder, {})
+        )
 
         self._folder_gallery.clear_gallery()
 
@@ -822,10 +1008,11 @@ class MainWindow(QMainWindow):
     #  Tab switching
     # ================================================================
 
+    def _on_tab_id_clicked(self, n: int):
+        self._on_tab_clicked(TAB_ORDER[n])
+
     def _on_tab_clicked(self, tab_id: str):
-        # Uncheck others
-        for tid, btn in self._tab_btns.items():
-            btn.setChecked(tid == tab_id)
+        # The exclusive button group has already unchecked the others
         self._current_tab = tab_id
 
         if tab_id == TAB_HIDDEN:
@@ -871,8 +1058,6 @@ class MainWindow(QMainWindow):
 
     def _scan_pdf_folders(self):
         """Scan known folders for PDFs and populate the PDF folder sidebar."""
-        self._pdf_folder_list.clear()
-
         from .config import SCAN_FOLDERS
 
         pdf_folders: dict[str, list[str]] = {}  # folder_path → [pdf paths]
@@ -914,26 +1099,21 @@ class MainWindow(QMainWindow):
         # Populate sidebar sorted by folder name
         self._pdf_folder_data = pdf_folders
         sorted_folders = sorted(pdf_folders.keys(), key=lambda p: Path(p).name.lower())
-        for folder_path in sorted_folders:
-            count = len(pdf_folders[folder_path])
-            display = f"{Path(folder_path).name}  ({count})"
-            item = QListWidgetItem(display)
-            item.setData(Qt.ItemDataRole.UserRole, folder_path)
-            self._pdf_folder_list.addItem(item)
+        _fill_list(self._pdf_folder_list, (
+            (f"{Path(folder_path).name}  ({len(pdf_folders[folder_path])})", folder_path)
+            for folder_path in sorted_folders
+        ))
 
     def _on_pdf_folder_selected(self, current: QListWidgetItem | None, prev=None):
         if current is None:
             return
         folder_path = current.data(Qt.ItemDataRole.UserRole)
-        self._pdf_file_list.clear()
 
         pdfs = self._pdf_folder_data.get(folder_path, [])
         pdfs.sort(key=lambda p: Path(p).name.lower())
-        for pdf_path in pdfs:
-            name = Path(pdf_path).name
-            item = QListWidgetItem(f"📄  {name}")
-            item.setData(Qt.ItemDataRole.UserRole, pdf_path)
-            self._pdf_file_list.addItem(item)
+        _fill_list(self._pdf_file_list, (
+            (f"📄  {Path(pdf_path).name}", pdf_path) for pdf_path in pdfs
+        ))
 
     def _on_pdf_file_double_clicked(self, item: QListWidgetItem):
         pdf_path = item.data(Qt.ItemDataRole.UserRole)
@@ -958,9 +1138,9 @@ class MainWindow(QMainWindow):
 
     def _repopulate_gallery(self):
         """Clear and repopulate the main gallery for the current tab + sort."""
-        filtered = [i for i in self._all_items
-                    if self._item_matches_tab(i, self._current_tab)]
-        filtered = self._sort_items(filtered, self._current_sort)
+        filtered = self._sorted_bucket(
+            self._current_tab, self._tab_items.get(self._current_tab, {})
+        )
 
         self._gallery.clear_gallery()
 
@@ -984,7 +1164,7 @@ class MainWindow(QMainWindow):
     def _add_gallery_item(self, gallery, item: MediaItem):
         """Helper: add a single media item to a gallery with thumb + selection."""
         gallery.add_media_item(item.name, item.path, item.media_type)
-        pm = self._thumb_cache.get(item.path)
+        pm = self._cached_thumb(item.path)
         if pm:
             gallery.set_thumbnail_pixmap(item.path, pm)
         if item.path in self._selected_paths:
@@ -996,77 +1176,110 @@ class MainWindow(QMainWindow):
         items: list[MediaItem], sort_key: str
     ) -> list[tuple[str, list[MediaItem]]]:
         """Group already-sorted items by date. Returns (date_label, items) pairs."""
-        if sort_key in ("created_desc", "created_asc"):
-            ts_fn = lambda i: i.created
-        else:
-            ts_fn = lambda i: i.modified
+        attr = "created" if sort_key in ("created_desc", "created_asc") else "modified"
 
-        groups: list[tuple[str, list[MediaItem]]] = []
-        prev_label = ""
-        for item in items:
-            label = datetime.fromtimestamp(ts_fn(item)).strftime("%d %B %Y")
-            if label != prev_label:
-                groups.append((label, []))
-                prev_label = label
-            groups[-1][1].append(item)
-        return groups
-
-    def _item_matches_tab(self, item: MediaItem, tab: str) -> bool:
-        if tab == TAB_ALL:
-            return True
-        if tab == TAB_PHOTOS:
-            return item.media_type == "photo"
-        if tab == TAB_VIDEOS:
-            return item.media_type == "video"
-        if tab == TAB_RECENT:
-            cutoff = (datetime.now() - timedelta(days=RECENT_DAYS)).timestamp()
-            return item.modified >= cutoff
-        if tab == TAB_SCREENSHOTS:
-            for sf in SCREENSHOT_FOLDERS:
-                try:
-                    Path(item.path).relative_to(sf)
-                    return item.media_type == "photo"
-                except ValueError:
-                    continue
-            return False
-        return False
+        def day(item: MediaItem) -> tuple[int, int, int]:
+            return time.localtime(getattr(item, attr))[:3]
+
+        # Format once per run of same-day items rather than once per item
+        return [
+            (date(*ymd).strftime("%d %B %Y"), list(run))
+            for ymd, run in groupby(items, key=day)
+        ]
+
+    @staticmethod
+    def _item_matches_tab(item: MediaItem, tab: str) -> bool:
+        """Check membership from the bits set by _ingest_items.
+
+        RECENT bits are cleared by _refresh_recent_cutoff as items age out.
+        """
+        return bool(item.tab_mask & _TAB_BIT.get(tab, 0))
+
+    def _is_screenshot(self, item: MediaItem) -> bool:
+        return os.path.normcase(item.path).startswith(self._screenshot_roots)
+
+    def _refresh_recent_cutoff(self):
+        """Advance the RECENT cutoff and drop items that have aged out."""
+        self._recent_cutoff = time.time() - RECENT_DAYS * 86400
+        bucket = self._tab_items[TAB_RECENT]
+        stale = [p for p, i in bucket.items() if i.modified < self._recent_cutoff]
+        if not stale:
+            return
+        bit = _TAB_BIT[TAB_RECENT]
+        for path in stale:
+            bucket.pop(path).tab_mask &= ~bit
+        for cache_key in [k for k in self._sorted_cache if k[0] == TAB_RECENT]:
+            del self._sorted_cache[cache_key]
 
     @staticmethod
-    def _sort_items(items: list[MediaItem], key: str) -> list[MediaItem]:
-        if key == "name_asc":
-            return sorted(items, key=lambda i: i.name.lower())
-        if key == "name_desc":
-            return sorted(items, key=lambda i: i.name.lower(), reverse=True)
-        if key == "created_desc":
-            return sorted(items, key=lambda i: i.created, reverse=True)
-        if key == "created_asc":
-            return sorted(items, key=lambda i: i.created)
-        if key == "modified_desc":
-            return sorted(items, key=lambda i: i.modified, reverse=True)
-        if key == "modified_asc":
-            return sorted(items, key=lambda i: i.modified)
-        if key == "size_asc":
-            return sorted(items, key=lambda i: i.size)
-        if key == "size_desc":
-            return sorted(items, key=lambda i: i.size, reverse=True)
-        return items
+    def _sort_items(items: Iterable[MediaItem], key: str) -> list[MediaItem]:
+        spec = _SORT_SPECS.get(key)
+        if spec is None:
+            return list(items)
+        key_fn, reverse = spec
+        return sorted(items, key=key_fn, reverse=reverse)
+
+    def _sorted_bucket(self, scope: str, bucket: dict[str, MediaItem]) -> list[MediaItem]:
+        """Return *bucket*'s items sorted by the current sort, reusing the last result.
+
+        The returned list is shared; callers must not mutate it.
+        """
+        cache_key = (scope, self._current_sort)
+        result = self._sorted_cache.get(cache_key)
+        if result is None:
+            if len(self._sorted_cache) >= _SORTED_CACHE_MAX:
+                del self._sorted_cache[next(iter(self._sorted_cache))]
+            result = self._sort_items(bucket.values(), self._current_sort)
+            self._sorted_cache[cache_key] = result
+        return result
 
     # ================================================================
     #  Hidden tab
     # ================================================================
 
     def _refresh_hidden(self):
+        """Show the hidden files, listing the folder off-thread if it changed."""
+        try:
+            mtime = self._ops.hidden_dir.stat().st_mtime_ns
+        except OSError:
+            mtime = -1
+        if self._hidden_cache and self._hidden_cache[0] == mtime:
+            self._show_hidden_items(self._hidden_cache[1])
+            return
+        if self._hidden_worker and self._hidden_worker.isRunning():
+            return  # its result is shown when it lands
+
+        self._hidden_worker = HiddenScanWorker(
+            self._ops.hidden_dir, self._ops.get_hidden_files, self,
+        )
+        self._hidden_worker.items_loaded.connect(self._on_hidden_loaded)
+        self._hidden_worker.finished.connect(self._clear_hidden_worker)
+        self._hidden_worker.start()
+
+    def _clear_hidden_worker(self):
+        self._hidden_worker = None
+
+    def _on_hidden_loaded(self, mtime: int, items: list[MediaItem]):
+        self._hidden_cache = (mtime, items)
+        if self._current_tab == TAB_HIDDEN:
+            self._show_hidden_items(items)
+
+    def _show_hidden_items(self, items: list[MediaItem]):
         self._hidden_gallery.clear_gallery()
-        for fpath in self._ops.get_hidden_files():
-            item = MediaItem.from_path(fpath)
-            if item:
-                self._hidden_gallery.add_media_item(item.name, item.path, item.media_type)
-                pm = self._thumb_cache.get(item.path)
-                if pm:
-                    self._hidden_gallery.set_thumbnail_pixmap(item.path, pm)
-                # Queue thumb generation if needed
-                if not pm and self._thumb_worker:
-                    self._thumb_worker.enqueue(item.path)
+        self._hidden_gallery.add_media_items_bulk(
+            (item.name, item.path, item.media_type) for item in items
+        )
+        missing = []
+        for item in items:
+            pm = self._cached_thumb(item.path)
+            if pm:
+                self._hidden_gallery.set_thumbnail_pixmap(item.path, pm)
+            else:
+                missing.append(item.path)
+        # Queue thumb generation if needed
+        if missing and self._thumb_worker:
+            self._thumb_worker.enqueue_batch(missing)
+        self._hidden_gallery.update_all_selection_orders(self._selected_paths)
 
         self._schedule_thumb_prioritization()
 
@@ -1075,19 +1288,21 @@ class MainWindow(QMainWindow):
             return
         self._thumb_prioritize_timer.start(75)
 
+    def _visible_gallery(self) -> GalleryWidget | None:
+        """Return the gallery shown for the current tab, if any."""
+        if self._current_tab == TAB_HIDDEN:
+            return self._hidden_gallery
+        if self._current_tab == TAB_FOLDERS:
+            return self._folder_gallery if self._active_folder else None
+        if self._current_tab == TAB_PDF_PNG:
+            return None
+        return self._gallery
+
     def _prioritize_visible_thumbnails(self):
         if self._thumb_worker is None:
             return
 
-        if self._current_tab == TAB_HIDDEN:
-            gallery = self._hidden_gallery
-        elif self._current_tab == TAB_FOLDERS:
-            gallery = self._folder_gallery if self._active_folder else None
-        elif self._current_tab == TAB_PDF_PNG:
-            gallery = None
-        else:
-            gallery = self._gallery
-
+        gallery = self._visible_gallery()
         if gallery is None:
             return
 
@@ -1123,6 +1338,9 @@ class MainWindow(QMainWindow):
     #  Selection
     # ================================================================
 
+    # Only the visible gallery is touched: every gallery is repopulated,
+    # selection included, whenever its tab is shown.
+
     def _toggle_select(self, path: str):
         if path in self._selected_paths:
             self._selected_paths.remove(path)
@@ -1130,22 +1348,22 @@ class MainWindow(QMainWindow):
             self._update_all_selection_orders()
         else:
             self._selected_paths.append(path)
-            order = len(self._selected_paths)
-            self._gallery.set_selection(path, True, order)
-            self._folder_gallery.set_selection(path, True, order)
+            gallery = self._visible_gallery()
+            if gallery:
+                gallery.set_selection(path, True, len(self._selected_paths))
         self._update_sel_label()
 
     def _update_all_selection_orders(self):
-        """Update selection order on all galleries after reordering."""
-        self._gallery.update_all_selection_orders(self._selected_paths)
-        self._folder_gallery.update_all_selection_orders(self._selected_paths)
-        self._hidden_gallery.update_all_selection_orders(self._selected_paths)
+        """Update selection order on the visible gallery after reordering."""
+        gallery = self._visible_gallery()
+        if gallery:
+            gallery.update_all_selection_orders(self._selected_paths)
 
     def _clear_selection(self):
         self._selected_paths.clear()
-        self._gallery.clear_all_selection()
-        self._hidden_gallery.clear_all_selection()
-        self._folder_gallery.clear_all_selection()
+        gallery = self._visible_gallery()
+        if gallery:
+            gallery.clear_all_selection()
         self._update_sel_label()
 
     def _update_sel_label(self):
@@ -1155,13 +1373,19 @@ class MainWindow(QMainWindow):
             self._btn_copy_sel.setVisible(bool(self._selected_images_for_copy()))
 
     def _selected_images_for_copy(self) -> list[str]:
-        images: list[str] = []
-        for path in self._selected_paths:
-            candidate = Path(path)
-            if candidate.suffix.lower() not in IMAGE_EXTENSIONS or not candidate.exists():
-                return []
-            images.append(str(candidate))
-        return images
+        # Existence is checked by copy_files_to_clipboard itself
+        images = self._selected_paths
+        if all(self._is_image_path(p) for p in images):
+            return list(images)
+        return []
+
+    def _is_image_path(self, path: str) -> bool:
+        """Classify *path* from the scan index, without touching the disk."""
+        item = self._items_by_path.get(path)
+        if item is not None:
+            return item.media_type == "photo"
+        # Hidden-tab selections are not part of the scanned library
+        return os.path.splitext(path)[1].lower() in IMAGE_EXTENSIONS
 
     def _copy_selected_images(self):
         images = self._selected_images_for_copy()
@@ -1178,18 +1402,13 @@ class MainWindow(QMainWindow):
     # ================================================================
 
     def _open_viewer(self, path: str):
-        paths = self._gallery.get_all_paths()
-        idx = paths.index(path) if path in paths else 0
-        self._launch_viewer(paths, idx)
+        self._launch_viewer(*self._viewer_items(self._gallery, path))
 
     def _open_viewer_folder(self, path: str):
-        paths = self._folder_gallery.get_all_paths()
-        idx = paths.index(path) if path in paths else 0
-        self._launch_viewer(paths, idx)
+        self._launch_viewer(*self._viewer_items(self._folder_gallery, path))
 
     def _open_viewer_hidden(self, path: str):
-        paths = self._hidden_gallery.get_all_paths()
-        idx = paths.index(path) if path in paths else 0
+        paths, idx = self._viewer_items(self._hidden_gallery, path)
         dlg = ViewerWindow(paths, idx, self._selected_paths, self)
         # For hidden viewer, swap hide → unhide behaviour
         dlg._btn_hide.setText("Unhide")
@@ -1202,6 +1421,11 @@ class MainWindow(QMainWindow):
         dlg.exec()
         self._active_viewer = None
 
+    @staticmethod
+    def _viewer_items(gallery: GalleryWidget, path: str) -> tuple[list[str], int]:
+        """Return a private copy of *gallery*'s paths and the index of *path*."""
+        return gallery.get_all_paths(), max(gallery.index_of(path), 0)
+
     def _launch_viewer(self, paths: list[str], idx: int):
         dlg = ViewerWindow(paths, idx, self._selected_paths, self)
         dlg.request_select.connect(self._viewer_toggle_select)
@@ -1214,19 +1438,7 @@ class MainWindow(QMainWindow):
         self._active_viewer = None
 
     def _viewer_toggle_select(self, path: str):
-        if path in self._selected_paths:
-            self._selected_paths.remove(path)
-            # Update order numbers for all remaining selections
-            self._update_all_selection_orders()
-        else:
-            self._selected_paths.append(path)
-            order = len(self._selected_paths)
-            # Update galleries if item visible
-            if self._gallery.path_exists(path):
-                self._gallery.set_selection(path, True, order)
-            if self._folder_gallery.path_exists(path):
-                self._folder_gallery.set_selection(path, True, order)
-        self._update_sel_label()
+        self._toggle_select(path)
 
     # ================================================================
     #  Actions: delete, hide, unhide, crop
@@ -1260,9 +1472,7 @@ class MainWindow(QMainWindow):
             # Re-add to main items
             item = MediaItem.from_path(restored)
             if item:
-                self._all_items.append(item)
-                if item.folder_path not in self._discovered_folders:
-                    self._discovered_folders[item.folder_path] = item.folder
+                self._ingest_items([item])
             # Invalidate thumb cache for old path
             self._thumb_cache.pop(path, None)
             if item and self._thumb_worker:
@@ -1270,15 +1480,29 @@ class MainWindow(QMainWindow):
 
     def _remove_item(self, path: str):
         """Remove an item from all data structures."""
-        self._all_items = [i for i in self._all_items if i.path != path]
-        if path in self._selected_paths:
-            self._selected_paths.remove(path)
+        self._remove_items([path])
+
+    def _remove_items(self, paths: list[str]):
+        """Remove several items from all data structures in one pass."""
+        gone = set(paths)
+        for path in paths:
+            item = self._items_by_path.pop(path, None)
+            if item is None:
+                continue
+            for bucket in self._tab_items.values():
+                bucket.pop(path, None)
+            self._folder_items.get(item.folder_path, {}).pop(path, None)
+        self._folder_sidebar_dirty = True
+        self._sorted_cache.clear()
+        if not gone.isdisjoint(self._selected_paths):
+            self._selected_paths[:] = [p for p in self._selected_paths if p not in gone]
             # Update all galleries with new order numbers
             self._update_all_selection_orders()
-        self._gallery.remove_by_path(path)
-        self._hidden_gallery.remove_by_path(path)
-        self._folder_gallery.remove_by_path(path)
-        self._thumb_cache.pop(path, None)
+        self._gallery.remove_paths(paths)
+        self._hidden_gallery.remove_paths(paths)
+        self._folder_gallery.remove_paths(paths)
+        for path in paths:
+            self._thumb_cache.pop(path, None)
         self._update_sel_label()
 
     def _do_crop(self, path: str):
@@ -1326,13 +1550,10 @@ class MainWindow(QMainWindow):
             self._thumb_worker.invalidate(saved_path)
             self._thumb_worker.enqueue(saved_path)
         # If it's a new file, add to items
-        existing = {i.path for i in self._all_items}
-        if saved_path not in existing:
+        if saved_path not in self._items_by_path:
             item = MediaItem.from_path(saved_path)
             if item:
-                self._all_items.append(item)
-                if item.folder_path not in self._discovered_folders:
-                    self._discovered_folders[item.folder_path] = item.folder
+                self._ingest_items([item])
                 if self._item_matches_tab(item, self._current_tab):
                     self._gallery.add_media_item(item.name, item.path, item.media_type)
 
@@ -1343,12 +1564,8 @@ class MainWindow(QMainWindow):
     def _generate_pdf(self):
         from .pdf_export import auto_filename, generate_pdf
 
-        # Only images from selection
-        img_exts = IMAGE_EXTENSIONS
-        images = [
-            p for p in self._selected_paths
-            if Path(p).suffix.lower() in img_exts and Path(p).exists()
-        ]
+        # Only images from selection; generate_pdf skips unreadable files
+        images = [p for p in self._selected_paths if self._is_image_path(p)]
         if not images:
             QMessageBox.information(
                 self, "No Images",
@@ -1479,12 +1696,10 @@ class MainWindow(QMainWindow):
         )
         if reply != QMessageBox.StandardButton.Yes:
             return
-        deleted = 0
-        for p in paths:
-            if self._ops.delete_to_trash(p):
-                self._remove_item(p)
-                deleted += 1
-        self._show_toast(f"🗑  {deleted} item(s) moved to Recycle Bin")
+        deleted = [p for p in paths if self._ops.delete_to_trash(p)]
+        if deleted:
+            self._remove_items(deleted)
+        self._show_toast(f"🗑  {len(deleted)} item(s) moved to Recycle Bin")
 
     # ================================================================
     #  Refresh / rescan
@@ -1503,10 +1718,21 @@ class MainWindow(QMainWindow):
             self._thumb_worker = None
 
         # Clear data stores
-        self._all_items.clear()
+        self._pending_flush_timer.stop()
+        self._pending_items.clear()
+        self._thumb_flush_timer.stop()
+        self._pending_thumbs.clear()
+        self._hidden_cache = None
+        self._items_by_path.clear()
+        for bucket in self._tab_items.values():
+            bucket.clear()
+        self._folder_items.clear()
+        self._sorted_cache.clear()
         self._selected_paths.clear()
         self._thumb_cache.clear()
+        self._thumb_evicted.clear()
         self._discovered_folders.clear()
+        self._discovered_folders_sorted.clear()
         self._active_folder = None
 
         # Clear galleries
@@ -1514,6 +1740,7 @@ class MainWindow(QMainWindow):
         self._hidden_gallery.clear_gallery()
         self._folder_gallery.clear_gallery()
         self._folder_list.clear()
+        self._folder_sidebar_dirty = True
 
         self._update_sel_label()
         self._show_toast("⟳  Refreshing…", 1500)
@@ -1553,4 +1780,6 @@ class MainWindow(QMainWindow):
         if self._thumb_worker:
             self._thumb_worker.stop()
             self._thumb_worker.wait(2000)
+        if self._hidden_worker:
+            self._hidden_worker.wait(2000)
         super().closeEvent(event)
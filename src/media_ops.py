@@ -94,6 +94,7 @@ class MediaOperations:
         self.hidden_dir.mkdir(parents=True, exist_ok=True)
         self.deleted_this_session: list[dict] = []
         self._hidden_map: dict[str, str] = {}  # hidden_path → original_path
+        self._log_records = 0  # entries appended since the last snapshot
         self._load_map()
 
     # ---- Delete ----
@@ -122,7 +123,7 @@ class MediaOperations:
             dst = self._unique_dst(dst)
             shutil.move(str(src), str(dst))
             self._hidden_map[str(dst)] = str(src)
-            self._save_map()
+            self._log_change({"op": "add", "k": str(dst), "v": str(src)})
             return str(dst)
         except Exception:
             return None
@@ -138,7 +139,7 @@ class MediaOperations:
             dst = self._unique_dst(dst)
             shutil.move(str(hidden_path), str(dst))
             del self._hidden_map[str(hidden_path)]
-            self._save_map()
+            self._log_change({"op": "del", "k": str(hidden_path)})
             return str(dst)
         except Exception:
             return None
@@ -148,7 +149,7 @@ class MediaOperations:
         result = []
         if self.hidden_dir.exists():
             for f in self.hidden_dir.iterdir():
-                if f.is_file() and f.name != ".hidden_map.json":
+                if f.is_file() and not f.name.startswith(".hidden_map."):
                     result.append(str(f))
         return result
 
@@ -160,7 +161,11 @@ class MediaOperations:
     def _map_file(self) -> Path:
         return self.hidden_dir / ".hidden_map.json"
 
+    def _log_file(self) -> Path:
+        return self.hidden_dir / ".hidden_map.log"
+
     def _load_map(self):
+        """Load the snapshot, then replay the change log written since."""
         mf = self._map_file()
         if mf.exists():
             try:
@@ -168,10 +173,48 @@ class MediaOperations:
                     self._hidden_map = json.load(fh)
             except Exception:
                 self._hidden_map = {}
+        lf = self._log_file()
+        if lf.exists():
+            try:
+                with open(lf, "r", encoding="utf-8") as fh:
+                    for line in fh:
+                        try:
+                            rec = json.loads(line)
+                        except ValueError:
+                            continue  # torn final line from a crash
+                        if rec.get("op") == "add":
+                            self._hidden_map[rec["k"]] = rec["v"]
+                        elif rec.get("op") == "del":
+                            self._hidden_map.pop(rec["k"], None)
+                        self._log_records += 1
+            except OSError:
+                pass
+
+    def _log_change(self, rec: dict):
+        """Append one hide/unhide record instead of rewriting the whole map."""
+        with open(self._log_file(), "a", encoding="utf-8") as fh:
+            fh.write(json.dumps(rec) + "\n")
+        self._log_records += 1
+        # Fold the log into a fresh snapshot once it outgrows the map
+        if self._log_records > max(64, 2 * len(self._hidden_map)):
+            self._save_map()
 
     def _save_map(self):
-        with open(self._map_file(), "w", encoding="utf-8") as fh:
+        """Write a full snapshot and drop the log it supersedes.
+
+        Replaying a log over a newer snapshot is harmless, so a crash
+        between the two steps loses nothing.
+        """
+        mf = self._map_file()
+        tmp = mf.with_name(mf.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as fh:
             json.dump(self._hidden_map, fh, indent=2)
+        os.replace(tmp, mf)
+        try:
+            self._log_file().unlink()
+        except FileNotFoundError:
+            pass
+        self._log_records = 0
 
     @staticmethod
     def _unique_dst(dst: Path) -> Path:
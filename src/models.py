@@ -4,7 +4,8 @@ Ash Album — Data models.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
@@ -20,6 +21,11 @@ class MediaItem:
     size: int  # bytes
     folder: str  # display name of parent folder (e.g. "Screenshots")
     folder_path: str  # absolute path of parent folder
+    name_lower: str = field(init=False, repr=False, compare=False)  # sort key
+    tab_mask: int = field(default=0, init=False, repr=False, compare=False)  # set by MainWindow
+
+    def __post_init__(self):
+        self.name_lower = self.name.lower()
 
     @classmethod
     def from_path(cls, filepath: str) -> MediaItem | None:
@@ -49,3 +55,23 @@ class MediaItem:
             folder=p.parent.name,
             folder_path=str(p.parent),
         )
+
+    @classmethod
+    def from_scandir(cls, entry: os.DirEntry[str], st: os.stat_result, media_type: str) -> MediaItem:
+        """Build from a directory-listing entry and its already-fetched stat.
+
+        The caller has already classified the extension, so unlike
+        from_path this does no filesystem access or suffix parsing.
+        """
+        name = entry.name
+        folder_path = os.path.dirname(entry.path)
+        return cls(
+            path=entry.path,
+            name=name,
+            media_type=media_type,
+            created=st.st_ctime,
+            modified=st.st_mtime,
+            size=st.st_size,
+            folder=os.path.basename(folder_path),
+            folder_path=folder_path,
+        )
@@ -1,10 +1,14 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Callable
 from PIL import Image as PILImage
-from reportlab.pdfgen import canvas
-from reportlab.lib.colors import black
-from reportlab.lib.pagesizes import A4
+import fitz  # PyMuPDF
+
+A4 = (595.28, 841.89)  # points
+BLACK = (0, 0, 0)
+PROBE_THREADS = 8
 
 
 def generate_pdf(
@@ -34,46 +38,30 @@ def _generate_pdf_default(image_paths: list[str], output_path: Path,
                           progress_callback: Callable[[int, int], bool] | None = None) -> Path:
     """Original behaviour: page size = widest image \u00d7 current image height."""
     # First pass: find maximum width
-    max_width = 0
-    sizes = []
-    total = len(image_paths)
-
-    for p in image_paths:
-        try:
-            with PILImage.open(p) as img:
-                w, h = img.size
-                sizes.append((p, w, h))
-                max_width = max(max_width, w)
-        except Exception:
-            continue
+    sizes = _probe_sizes(image_paths)
+    max_width = max((w for _, w, _ in sizes), default=0)
 
-    c = canvas.Canvas(str(output_path))
+    doc = fitz.open()
 
     for idx, (img_path, w, h) in enumerate(sizes):
         if progress_callback and not progress_callback(idx, len(sizes)):
-            c.save()
-            return output_path
+            return _save(doc, output_path)
 
         # Page size = widest image x current image height
-        c.setPageSize((max_width, h))
+        page = doc.new_page(width=max_width, height=h)
 
         # Paint black background
-        c.setFillColor(black)
-        c.rect(0, 0, max_width, h, stroke=0, fill=1)
+        page.draw_rect(page.rect, color=None, fill=BLACK)
 
         # Center image horizontally
         x = (max_width - w) / 2
 
         # Draw image (no scaling)
-        c.drawImage(img_path, x, 0, width=w, height=h, mask="auto")
-
-        if idx < len(sizes) - 1:
-            c.showPage()
+        _insert_image(page, fitz.Rect(x, 0, x + w, h), img_path)
 
     if progress_callback:
         progress_callback(len(sizes), len(sizes))
-    c.save()
-    return output_path
+    return _save(doc, output_path)
 
 
 def _generate_pdf_a4(image_paths: list[str], output_path: Path,
@@ -82,13 +70,11 @@ def _generate_pdf_a4(image_paths: list[str], output_path: Path,
     a4_w, a4_h = A4  # 595.28 \u00d7 841.89 points
     total = len(image_paths)
 
-    c = canvas.Canvas(str(output_path), pagesize=A4)
+    doc = fitz.open()
 
-    drawn = 0
     for idx, img_path in enumerate(image_paths):
         if progress_callback and not progress_callback(idx, total):
-            c.save()
-            return output_path
+            return _save(doc, output_path)
 
         try:
             with PILImage.open(img_path) as img:
@@ -97,8 +83,8 @@ def _generate_pdf_a4(image_paths: list[str], output_path: Path,
             continue
 
         # Black background
-        c.setFillColor(black)
-        c.rect(0, 0, a4_w, a4_h, stroke=0, fill=1)
+        page = doc.new_page(width=a4_w, height=a4_h)
+        page.draw_rect(page.rect, color=None, fill=BLACK)
 
         # Scale image to fit within A4 while keeping aspect ratio
         scale = min(a4_w / w, a4_h / h)
@@ -109,15 +95,56 @@ def _generate_pdf_a4(image_paths: list[str], output_path: Path,
         x = (a4_w - draw_w) / 2
         y = (a4_h - draw_h) / 2
 
-        c.drawImage(img_path, x, y, width=draw_w, height=draw_h, mask="auto")
-        drawn += 1
-
-        if idx < len(image_paths) - 1:
-            c.showPage()
+        _insert_image(page, fitz.Rect(x, y, x + draw_w, y + draw_h), img_path)
 
     if progress_callback:
         progress_callback(total, total)
-    c.save()
+    return _save(doc, output_path)
+
+
+def _probe_size(path: str) -> tuple[str, int, int] | None:
+    try:
+        with PILImage.open(path) as img:
+            w, h = img.size
+            return path, w, h
+    except Exception:
+        return None
+
+
+def _probe_sizes(image_paths: list[str]) -> list[tuple[str, int, int]]:
+    """Read every image's size from its header, overlapping the file opens.
+
+    Unreadable images are dropped; the rest keep their order.
+    """
+    with ThreadPoolExecutor(max_workers=PROBE_THREADS) as ex:
+        return [r for r in ex.map(_probe_size, image_paths) if r is not None]
+
+
+def _insert_image(page: fitz.Page, rect: fitz.Rect, img_path: str):
+    """Place *img_path* in *rect*, embedding JPEG/PNG data as-is.
+
+    Formats MuPDF can't read directly are converted to PNG through Pillow.
+    """
+    try:
+        page.insert_image(rect, filename=img_path, keep_proportion=False)
+        return
+    except Exception:
+        pass
+    with PILImage.open(img_path) as img:
+        if img.mode not in ("RGB", "RGBA", "L"):
+            img = img.convert("RGBA")
+        buf = io.BytesIO()
+        img.save(buf, "PNG")
+    page.insert_image(rect, stream=buf.getvalue(), keep_proportion=False)
+
+
+def _save(doc: fitz.Document, output_path: Path) -> Path:
+    # A cancelled export still writes the pages done so far; like the
+    # old ReportLab canvas, an export with no pages gets one blank page
+    if not doc.page_count:
+        doc.new_page()
+    doc.save(str(output_path), garbage=3, deflate=True)
+    doc.close()
     return output_path
 
 
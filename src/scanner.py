@@ -8,11 +8,14 @@ discovered MediaItem objects in batches for UI consumption.
 from __future__ import annotations
 
 import os
+import time
+from collections import deque
 from pathlib import Path
+from typing import Callable
 
 from PySide6.QtCore import QThread, Signal
 
-from .config import IMAGE_EXTENSIONS, VIDEO_EXTENSIONS, SCAN_FOLDERS
+from .config import ALL_EXTENSIONS, SCAN_FOLDERS, VIDEO_EXTENSIONS
 from .models import MediaItem
 
 # Folders we never descend into
@@ -27,7 +30,15 @@ _SKIP_DIRS = frozenset({
     "venv",
 })
 
-BATCH_SIZE = 40  # emit items in batches for fewer signals
+# Media extensions without the dot; names with a longer suffix are
+# rejected before anything is lowercased
+_EXT_SET = frozenset(e.lstrip(".") for e in ALL_EXTENSIONS)
+_MAX_EXT_LEN = max(map(len, _EXT_SET))
+_VIDEO_EXT_SET = frozenset(e.lstrip(".") for e in VIDEO_EXTENSIONS)
+
+# Emit items in batches for fewer signals: whichever limit is hit first
+BATCH_SIZE = 500
+BATCH_INTERVAL = 0.1  # seconds
 
 
 class ScannerWorker(QThread):
@@ -43,7 +54,7 @@ class ScannerWorker(QThread):
         hidden_dir: Path | None = None,
     ):
         super().__init__()
-        self.scan_folders = scan_folders or list(SCAN_FOLDERS)
+        self.scan_folders = _outermost_roots(scan_folders or list(SCAN_FOLDERS))
         self.hidden_dir = hidden_dir
         self._stop = False
 
@@ -53,70 +64,130 @@ class ScannerWorker(QThread):
     def run(self):
         count = 0
         batch: list[MediaItem] = []
-        visited: set[str] = set()
-        all_ext = IMAGE_EXTENSIONS | VIDEO_EXTENSIONS
+        last_emit = time.monotonic()
+        # Directories already listed, so overlapping scan roots (or a
+        # junction into one) are walked once; the hidden dir never is
+        visited: set[object] = set()
+        if self.hidden_dir:
+            key = _dir_key(self.hidden_dir)
+            if key is not None:
+                visited.add(key)
 
         for folder in self.scan_folders:
             if self._stop:
                 break
             folder = Path(folder)
-            if not folder.exists() or not folder.is_dir():
+            if not folder.is_dir():
                 continue
 
             self.scan_progress.emit(f"Scanning {folder.name}…")
 
-            for root, dirs, files in os.walk(folder, topdown=True):
-                if self._stop:
-                    break
-
-                root_path = Path(root)
-
-                # Skip the hidden directory
-                if self.hidden_dir:
-                    try:
-                        root_path.relative_to(self.hidden_dir)
-                        dirs.clear()
-                        continue
-                    except ValueError:
-                        pass
-
-                # Prune unwanted subdirectories
-                dirs[:] = [
-                    d for d in dirs
-                    if d not in _SKIP_DIRS and not d.startswith(".")
-                ]
-
-                for fname in files:
-                    if self._stop:
-                        break
-
-                    fpath = root_path / fname
-                    ext = fpath.suffix.lower()
-                    if ext not in all_ext:
-                        continue
-
-                    # Deduplicate across overlapping scan roots
-                    try:
-                        resolved = str(fpath.resolve())
-                    except OSError:
-                        continue
-                    if resolved in visited:
-                        continue
-                    visited.add(resolved)
-
-                    item = MediaItem.from_path(resolved)
-                    if item is None:
-                        continue
-
-                    batch.append(item)
-                    count += 1
-
-                    if len(batch) >= BATCH_SIZE:
-                        self.items_found.emit(batch)
-                        batch = []
+            pending = deque([str(folder)])
+            while pending and not self._stop:
+                root = pending.popleft()
+                key = _dir_key(root)
+                if key is None or key in visited:
+                    continue
+                visited.add(key)
+
+                try:
+                    it = os.scandir(root)
+                except OSError:
+                    continue
+                with it:
+                    for entry in it:
+                        if self._stop:
+                            break
+                        name = entry.name
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                # Prune unwanted subdirectories
+                                if name not in _SKIP_DIRS and not name.startswith("."):
+                                    pending.append(entry.path)
+                                continue
+                            i = name.rfind(".")
+                            if i < 0 or len(name) - i - 1 > _MAX_EXT_LEN:
+                                continue
+                            ext = name[i + 1:].lower()
+                            if ext not in _EXT_SET or not entry.is_file():
+                                continue
+                            st = entry.stat()
+                        except OSError:
+                            continue
+
+                        media_type = "video" if ext in _VIDEO_EXT_SET else "photo"
+                        batch.append(MediaItem.from_scandir(entry, st, media_type))
+                        count += 1
+
+                        if len(batch) >= BATCH_SIZE:
+                            self.items_found.emit(batch)
+                            batch = []
+                            last_emit = time.monotonic()
+
+                # Checked per directory, so a slow walk still shows progress
+                if batch and time.monotonic() - last_emit >= BATCH_INTERVAL:
+                    self.items_found.emit(batch)
+                    batch = []
+                    last_emit = time.monotonic()
 
         # Flush remaining
         if batch:
             self.items_found.emit(batch)
 
         self.scan_finished.emit(count)
+
+
+def _outermost_roots(folders: list[Path]) -> list[Path]:
+    """Drop folders that lie inside another folder in *folders*.
+
+    The check is lexical; links between roots are still caught by the
+    per-directory keys during the walk.  Order is otherwise preserved.
+    """
+    norm = [os.path.join(os.path.normcase(os.path.abspath(f)), "") for f in folders]
+    kept = []
+    for i, (folder, key) in enumerate(zip(folders, norm)):
+        inside = any(
+            key.startswith(other) and (key != other or j < i)
+            for j, other in enumerate(norm) if j != i
+        )
+        if not inside:
+            kept.append(Path(folder))
+    return kept
+
+
+def _dir_key(path: str | Path) -> object | None:
+    """Identify a directory by (device, inode), or None if it can't be read.
+
+    Filesystems without inode numbers fall back to the normalised path.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if st.st_ino:
+        return (st.st_dev, st.st_ino)
+    return os.path.normcase(os.path.abspath(path))
+
+
+class HiddenScanWorker(QThread):
+    """Lists the hidden folder and builds its MediaItems off the GUI thread."""
+
+    items_loaded = Signal(int, list)    # (hidden_dir mtime_ns, list[MediaItem])
+
+    def __init__(self, hidden_dir: Path, hidden_files: Callable[[], list[str]], parent=None):
+        super().__init__(parent)
+        self.hidden_dir = Path(hidden_dir)
+        self._hidden_files = hidden_files
+
+    def run(self):
+        # Stat first, so a change made while listing invalidates the result
+        try:
+            mtime = self.hidden_dir.stat().st_mtime_ns
+        except OSError:
+            mtime = -1
+        items = []
+        for fpath in self._hidden_files():
+            item = MediaItem.from_path(fpath)
+            if item is not None:
+                items.append(item)
+        self.items_loaded.emit(mtime, items)
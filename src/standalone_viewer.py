@@ -144,7 +144,7 @@ class StandaloneViewer(QMainWindow):
                 self._all_paths.append(saved_path)
                 self._all_paths.sort(key=lambda x: Path(x).name.lower())
                 # Update viewer's internal list
-                self._viewer._items = list(self._all_paths)
+                self._viewer.set_items(list(self._all_paths))
         # Refresh current view (file may have been overwritten)
         self._viewer._show_current()
 
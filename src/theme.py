@@ -2,6 +2,8 @@
 Ash Album — Dark theme stylesheet and colour palette.
 """
 
+from functools import lru_cache
+
 COLORS = {
     "bg_darkest": "#0b0b12",
     "bg_dark": "#111119",
@@ -25,6 +27,7 @@ COLORS = {
 }
 
 
+@lru_cache(maxsize=1)
 def get_stylesheet() -> str:
     c = COLORS
     return f"""
@@ -211,6 +214,72 @@ def get_stylesheet() -> str:
         color: {c['text_dim']};
     }}
 
+    /* ======== First-run dialog ======== */
+    QLabel#firstRunDesc {{
+        color: {c['text_dim']};
+        font-size: 13px;
+    }}
+    QLabel#pathBox {{
+        background-color: {c['bg_light']};
+        border: 1px solid {c['border']};
+        border-radius: 6px;
+        padding: 10px;
+        font-size: 12px;
+    }}
+    QLabel#extBox {{
+        background-color: {c['bg_light']};
+        border: 1px solid {c['border']};
+        border-radius: 6px;
+        padding: 14px;
+        font-size: 14px;
+        font-weight: 600;
+        letter-spacing: 2px;
+    }}
+
+    /* ======== Crop dialog ======== */
+    QDialog#cropDialog {{
+        background-color: {c['bg_darkest']};
+    }}
+    QWidget#cropBar {{
+        background-color: {c['bg_mid']};
+    }}
+    QPushButton#cropCancelBtn, QPushButton#cropOverwriteBtn, QPushButton#cropSaveAsBtn {{
+        border-radius: 8px;
+        padding: 6px 20px;
+        font-weight: 700;
+        font-size: 12px;
+    }}
+    QPushButton#cropCancelBtn {{
+        background-color: {c['bg_lighter']};
+        color: {c['text']};
+        border: 1px solid {c['border']};
+    }}
+    QPushButton#cropCancelBtn:hover {{
+        background-color: {c['accent']};
+        color: #fff;
+        border-color: {c['accent']};
+    }}
+    QPushButton#cropOverwriteBtn {{
+        background-color: {c['danger']};
+        color: #ffffff;
+        border: none;
+    }}
+    QPushButton#cropOverwriteBtn:hover {{
+        background-color: #f44336;
+    }}
+    QPushButton#cropSaveAsBtn {{
+        background-color: {c['accent']};
+        color: #ffffff;
+        border: none;
+    }}
+    QPushButton#cropSaveAsBtn:hover {{
+        background-color: {c['accent_hover']};
+    }}
+    QPushButton#cropOverwriteBtn:disabled, QPushButton#cropSaveAsBtn:disabled {{
+        background-color: {c['bg_light']};
+        color: {c['text_muted']};
+    }}
+
     /* ======== Status Bar ======== */
     QStatusBar {{
         background-color: {c['bg_darkest']};
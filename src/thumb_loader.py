@@ -1,27 +1,47 @@
 """
 Ash Album — Background thumbnail generator with disk cache.
 
-Uses a dedicated QThread that processes a work queue.  Thumbnails are
-saved to the cache directory so subsequent launches are fast.
+Uses a dedicated QThread that drains a work queue together with a small
+pool of helper threads, so several files decode at once.  Thumbnails are
+stored in one SQLite database in the cache directory, keyed by source path
+and validated by size and mtime, so subsequent launches are fast.
 """
 
 from __future__ import annotations
 
-import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 
-from PySide6.QtCore import QThread, Signal, QMutex, QWaitCondition
-from PySide6.QtGui import QImage
+from PySide6.QtCore import Qt, QBuffer, QIODevice, QSize, QThread, QThreadPool, Signal, QMutex, QWaitCondition
+from PySide6.QtGui import QImage, QImageReader
 
 from PIL import Image as PILImage
 
 from .config import VIDEO_EXTENSIONS, THUMB_SIZE
 
+# Decoding threads, leaving one core free for the GUI
+THUMB_THREADS = max(1, min(4, (os.cpu_count() or 2) - 1))
+
+CACHE_DB_NAME = "thumbs.sqlite"
+# Per-file cache entries written by versions before the database
+_LEGACY_CACHE_SUFFIXES = frozenset({".jpg", ".sig", ".failed"})
+
+# Finished thumbnails are emitted together once either limit is reached
+READY_BATCH_SIZE = 16
+READY_BATCH_INTERVAL = 0.03  # seconds
+
+# Opaque formats whose Qt readers decode straight to a reduced size
+_SCALED_READ_EXTENSIONS = frozenset({".jpg", ".jpeg"})
+
 
 class ThumbnailWorker(QThread):
     """Generates thumbnails for media files on a background thread."""
 
-    thumbnail_ready = Signal(str, QImage)  # (file_path, thumb)
+    thumbnails_ready = Signal(list)  # list[(file_path, thumb)]
 
     def __init__(self, cache_dir: str | Path, thumb_size: int = THUMB_SIZE):
         super().__init__()
@@ -29,36 +49,44 @@ class ThumbnailWorker(QThread):
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.thumb_size = thumb_size
 
-        self._queue: list[str] = []
+        # Pending paths in processing order; doubles as the membership set
+        self._queue: OrderedDict[str, None] = OrderedDict()
         self._mutex = QMutex()
         self._cond = QWaitCondition()
         self._stop = False
         self._processed: set[str] = set()
+        self._ready: list[tuple[str, QImage]] = []
+        self._last_emit = 0.0
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(max(1, THUMB_THREADS - 1))
+        # sqlite3 connections are per thread
+        self._local = threading.local()
 
     # ---- public queue API ----
 
     def enqueue(self, file_path: str):
         self._mutex.lock()
         if file_path not in self._processed and file_path not in self._queue:
-            self._queue.append(file_path)
+            self._queue[file_path] = None
             self._cond.wakeOne()
         self._mutex.unlock()
 
     def enqueue_batch(self, paths: list[str]):
         self._mutex.lock()
+        queue = self._queue
         for fp in paths:
-            if fp not in self._processed and fp not in self._queue:
-                self._queue.append(fp)
-        self._cond.wakeOne()
+            if fp not in self._processed:
+                queue.setdefault(fp, None)
+        self._cond.wakeAll()
         self._mutex.unlock()
 
     def prioritize(self, paths: list[str]):
         """Move *paths* to the front of the queue (for visible-area loading)."""
         self._mutex.lock()
-        pset = set(paths)
-        front = [p for p in paths if p in set(self._queue)]
-        rest = [p for p in self._queue if p not in pset]
-        self._queue = front + rest
+        queue = self._queue
+        for p in reversed(paths):
+            if p in queue:
+                queue.move_to_end(p, last=False)
         self._cond.wakeOne()
         self._mutex.unlock()
 
@@ -77,144 +105,205 @@ class ThumbnailWorker(QThread):
     # ---- thread entry ----
 
     def run(self):
+        if not (self.cache_dir / CACHE_DB_NAME).exists():
+            self._remove_legacy_cache_files()
+        # Helpers share the queue with this thread; stop() wakes them all
+        for _ in range(THUMB_THREADS - 1):
+            self._pool.start(self._drain)
+        self._drain()
+        self._pool.waitForDone()
+
+    def _drain(self):
         while not self._stop:
             self._mutex.lock()
             while not self._queue and not self._stop:
+                if self._ready:
+                    # Don't sit on finished thumbnails while idle
+                    batch, self._ready = self._ready, []
+                    self._mutex.unlock()
+                    self.thumbnails_ready.emit(batch)
+                    self._mutex.lock()
+                    continue
                 self._cond.wait(self._mutex)
             if self._stop:
                 self._mutex.unlock()
                 break
-            file_path = self._queue.pop(0) if self._queue else None
-            self._mutex.unlock()
-
-            if file_path is None or file_path in self._processed:
+            file_path = self._queue.popitem(last=False)[0]
+            if file_path in self._processed:
+                self._mutex.unlock()
                 continue
             self._processed.add(file_path)
+            self._mutex.unlock()
 
             try:
                 img = self._load_or_generate(file_path)
                 if img and not img.isNull():
-                    self.thumbnail_ready.emit(file_path, img)
+                    self._push_ready(file_path, self._for_display(img))
             except Exception:
                 pass
 
+    def _push_ready(self, file_path: str, img: QImage):
+        """Queue a finished thumbnail and emit the batch when it is due.
+
+        A drained queue flushes at once, so the last thumbnails of a run
+        never wait for company.
+        """
+        batch = None
+        self._mutex.lock()
+        self._ready.append((file_path, img))
+        now = time.monotonic()
+        if (len(self._ready) >= READY_BATCH_SIZE
+                or now - self._last_emit >= READY_BATCH_INTERVAL
+                or not self._queue):
+            batch, self._ready = self._ready, []
+            self._last_emit = now
+        self._mutex.unlock()
+        if batch:
+            self.thumbnails_ready.emit(batch)
+
     # ---- generation helpers ----
 
-    def _cache_path(self, file_path: str) -> Path:
-        h = hashlib.md5(file_path.encode("utf-8")).hexdigest()
-        return self.cache_dir / f"{h}.jpg"
+    def _fit(self, img: QImage) -> QImage:
+        """Scale *img* so its longer side is exactly thumb_size.
+
+        Done here so the GUI thread only has to wrap it in a QPixmap.
+        """
+        if max(img.width(), img.height()) == self.thumb_size:
+            return img
+        return img.scaled(
+            self.thumb_size, self.thumb_size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+
+    def _for_display(self, img: QImage) -> QImage:
+        """Fit *img* and convert it to the raster backend's native format.
+
+        QPixmap must not be created off the GUI thread, but with an
+        RGB32 image QPixmap.fromImage there is a plain wrap with no
+        per-pixel conversion.
+        """
+        return self._fit(img).convertToFormat(QImage.Format.Format_RGB32)
+
+    # ---- disk cache ----
+
+    def _db(self) -> sqlite3.Connection:
+        """Return this thread's connection to the thumbnail database."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.cache_dir / CACHE_DB_NAME, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS thumbs ("
+                "path TEXT PRIMARY KEY, sig TEXT NOT NULL, data BLOB NOT NULL)"
+            )
+            self._local.conn = conn
+        return conn
 
-    def _failed_path(self, file_path: str) -> Path:
-        h = hashlib.md5(file_path.encode("utf-8")).hexdigest()
-        return self.cache_dir / f"{h}.failed"
+    def _cache_get(self, file_path: str) -> tuple[str, bytes] | None:
+        try:
+            return self._db().execute(
+                "SELECT sig, data FROM thumbs WHERE path = ?", (file_path,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
 
-    def _legacy_sig_path(self, file_path: str) -> Path:
-        h = hashlib.md5(file_path.encode("utf-8")).hexdigest()
-        return self.cache_dir / f"{h}.sig"
+    def _cache_put(self, file_path: str, signature: str, data: bytes):
+        try:
+            with self._db() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO thumbs (path, sig, data) VALUES (?, ?, ?)",
+                    (file_path, signature, data),
+                )
+        except sqlite3.Error:
+            pass
+
+    def _cache_drop(self, file_path: str):
+        try:
+            with self._db() as conn:
+                conn.execute("DELETE FROM thumbs WHERE path = ?", (file_path,))
+        except sqlite3.Error:
+            pass
+
+    def _remove_legacy_cache_files(self):
+        """Delete the per-file .jpg/.sig/.failed cache of older versions."""
+        try:
+            entries = list(os.scandir(self.cache_dir))
+        except OSError:
+            return
+        for entry in entries:
+            stem, ext = os.path.splitext(entry.name)
+            if ext in _LEGACY_CACHE_SUFFIXES and len(stem) == 32:
+                try:
+                    os.unlink(entry.path)
+                except OSError:
+                    pass
 
     @staticmethod
     def _file_signature_from_stat(st) -> str:
         return f"{st.st_size}:{st.st_mtime_ns}"
 
-    def _load_or_generate(self, file_path: str) -> QImage | None:
-        cp = self._cache_path(file_path)
-        sp = self._legacy_sig_path(file_path)
-        fp = self._failed_path(file_path)
-        source_path = Path(file_path)
-
-        if not source_path.exists():
-            for stale in (cp, sp, fp):
-                if stale.exists():
-                    try:
-                        stale.unlink()
-                    except OSError:
-                        pass
-            return None
+    @staticmethod
+    def _encode_jpeg(img: QImage) -> bytes:
+        buf = QBuffer()
+        buf.open(QIODevice.OpenModeFlag.WriteOnly)
+        img.save(buf, "JPEG", 85)
+        return bytes(buf.data())
 
+    def _load_or_generate(self, file_path: str) -> QImage | None:
         try:
-            source_stat = source_path.stat()
+            source_stat = os.stat(file_path)
         except OSError:
+            self._cache_drop(file_path)
             return None
         signature = self._file_signature_from_stat(source_stat)
 
-        # If this file previously failed thumbnail generation and has not changed,
-        # skip re-decoding to avoid repeated noisy backend errors and slow rescans.
-        if fp.exists() and signature:
-            try:
-                if fp.read_text(encoding="utf-8").strip() == signature:
-                    return None
-            except OSError:
-                pass
+        row = self._cache_get(file_path)
+        if row and row[0] == signature:
+            # An empty blob records a video that failed before and has not
+            # changed; skip re-decoding to avoid repeated noisy backend
+            # errors and slow rescans.
+            if not row[1]:
+                return None
+            img = QImage.fromData(row[1], "JPEG")
+            if not img.isNull():
+                return img
 
-        if cp.exists():
-            # Fast-path cache validation based on mtime.
-            # If source is newer than cached thumb, regenerate.
-            cache_valid = False
-            try:
-                cache_valid = source_stat.st_mtime_ns <= cp.stat().st_mtime_ns
-            except OSError:
-                cache_valid = False
-
-            if cache_valid:
-                img = QImage(str(cp))
-                if not img.isNull():
-                    # Clean up one-time legacy sidecar if present.
-                    if sp.exists():
-                        try:
-                            sp.unlink()
-                        except OSError:
-                            pass
-                    if fp.exists():
-                        try:
-                            fp.unlink()
-                        except OSError:
-                            pass
-                    return img
-            else:
-                for stale in (cp, sp):
-                    if stale.exists():
-                        try:
-                            stale.unlink()
-                        except OSError:
-                            pass
-
-        ext = source_path.suffix.lower()
+        ext = os.path.splitext(file_path)[1].lower()
         if ext in VIDEO_EXTENSIONS:
             img = self._video_thumb(file_path)
         else:
             img = self._image_thumb(file_path)
 
         if img and not img.isNull():
-            img.save(str(cp), "JPEG", 85)
-            if sp.exists():
-                try:
-                    sp.unlink()
-                except OSError:
-                    pass
-            if fp.exists():
-                try:
-                    fp.unlink()
-                except OSError:
-                    pass
-        elif ext in VIDEO_EXTENSIONS and signature:
-            if sp.exists():
-                try:
-                    sp.unlink()
-                except OSError:
-                    pass
-            try:
-                fp.write_text(signature, encoding="utf-8")
-            except OSError:
-                pass
+            # Cache at display size so later sessions can show it as-is.
+            img = self._fit(img)
+            self._cache_put(file_path, signature, self._encode_jpeg(img))
+        elif ext in VIDEO_EXTENSIONS:
+            self._cache_put(file_path, signature, b"")
+        elif row:
+            self._cache_drop(file_path)
         return img
 
     def _image_thumb(self, file_path: str) -> QImage | None:
+        if Path(file_path).suffix.lower() in _SCALED_READ_EXTENSIONS:
+            img = self._scaled_read(file_path)
+            if img is not None:
+                return img
         try:
             with PILImage.open(file_path) as pil:
-                pil.thumbnail((self.thumb_size, self.thumb_size), PILImage.LANCZOS)
+                if pil.format == "JPEG":
+                    # Let libjpeg's DCT scaling decode at 1/2..1/8 size; from
+                    # at most 2x the target, bilinear is indistinguishable
+                    pil.draft("RGB", (self.thumb_size * 2, self.thumb_size * 2))
+                    resample = PILImage.Resampling.BILINEAR
+                else:
+                    resample = PILImage.Resampling.LANCZOS
+                pil.thumbnail((self.thumb_size, self.thumb_size), resample)
                 if pil.mode == "RGBA":
                     bg = PILImage.new("RGB", pil.size, (24, 24, 40))
-                    bg.paste(pil, mask=pil.split()[3])
+                    bg.paste(pil, mask=pil.getchannel("A"))
                     pil = bg
                 elif pil.mode != "RGB":
                     pil = pil.convert("RGB")
@@ -223,10 +312,31 @@ class ThumbnailWorker(QThread):
                     data, pil.width, pil.height,
                     pil.width * 3, QImage.Format.Format_RGB888,
                 )
-                return qimg.copy()
+                # Converting detaches from *data* and yields the display
+                # format in one pass, so no separate copy() is needed
+                return qimg.convertToFormat(QImage.Format.Format_RGB32)
         except Exception:
             return None
 
+    def _scaled_read(self, file_path: str) -> QImage | None:
+        """Decode *file_path* directly at thumbnail size with QImageReader.
+
+        The JPEG reader pushes the scale into libjpeg's IDCT, so the
+        full-resolution bitmap is never built.  Returns None to fall back
+        to Pillow.
+        """
+        reader = QImageReader(file_path)
+        if not reader.canRead():
+            return None
+        size = reader.size()
+        w, h = size.width(), size.height()
+        if w <= 0 or h <= 0:
+            return None
+        scale = min(1.0, self.thumb_size / max(w, h))
+        reader.setScaledSize(QSize(max(1, round(w * scale)), max(1, round(h * scale))))
+        img = reader.read()
+        return None if img.isNull() else img
+
     def _video_thumb(self, file_path: str) -> QImage | None:
         try:
             import cv2
@@ -254,12 +364,17 @@ class ThumbnailWorker(QThread):
             h, w = frame.shape[:2]
             scale = self.thumb_size / max(h, w)
             nw, nh = int(w * scale), int(h * scale)
+            if scale < 0.25:
+                # INTER_AREA is costly on large frames; a nearest-neighbour
+                # pass to 2x the target first leaves it little to average
+                frame = cv2.resize(frame, (nw * 2, nh * 2), interpolation=cv2.INTER_NEAREST)
             frame = cv2.resize(frame, (nw, nh), interpolation=cv2.INTER_AREA)
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
 
+            # Read OpenCV's BGR directly; converting to RGB32 is the one
+            # copy into Qt-owned storage, and the display format as well
             qimg = QImage(
-                frame.data, nw, nh, nw * 3, QImage.Format.Format_RGB888,
+                frame.data, nw, nh, frame.strides[0], QImage.Format.Format_BGR888,
             )
-            return qimg.copy()
+            return qimg.convertToFormat(QImage.Format.Format_RGB32)
         except Exception:
             return None
@@ -4,10 +4,11 @@ Ash Album —  Full-screen media viewer with action buttons and video playback.
 
 from __future__ import annotations
 
-from pathlib import Path
+import os
+from functools import lru_cache
 
-from PySide6.QtCore import Qt, Signal, QSize, QTimer, QUrl, QEvent
-from PySide6.QtGui import QFont, QPixmap, QKeySequence, QShortcut, QImage
+from PySide6.QtCore import Qt, Signal, QSize, QTimer, QUrl, QEvent, QObject, QRunnable, QThreadPool
+from PySide6.QtGui import QFont, QPixmap, QPixmapCache, QKeySequence, QShortcut, QImage, QImageReader
 from PySide6.QtWidgets import (
     QDialog,
     QHBoxLayout,
@@ -24,6 +25,106 @@ from .config import VIDEO_EXTENSIONS
 from .media_ops import copy_files_to_clipboard
 from .theme import COLORS
 
+# Decoded full-size images are large; leave room for a few dozen
+VIEWER_CACHE_KB = 256 * 1024
+# Neighbours decoded ahead of navigation, nearest first
+PREFETCH_OFFSETS = (1, -1, 2)
+# Images are decoded at up to this multiple of the screen size, which
+# covers zooming in that far; deeper zoom reloads at full resolution
+DECODE_ZOOM_HEADROOM = 2
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+_NAV_BTN_STYLE = (
+    f"QPushButton {{ background: transparent; color: {COLORS['text_dim']}; "
+    f"font-size: 26px; border: none; }}"
+    f"QPushButton:hover {{ color: {COLORS['text']}; "
+    f"background: {COLORS['bg_mid']}; }}"
+)
+
+
+@lru_cache(maxsize=32)
+def _viewer_btn_style(bg: str, hover: str) -> str:
+    return (
+        f"QPushButton {{ background-color: {bg}; color: #ffffff; "
+        f"border: none; border-radius: 8px; padding: 6px 22px; "
+        f"font-weight: 700; font-size: 12px; }}"
+        f"QPushButton:hover {{ background-color: {hover}; }}"
+        f"QPushButton:pressed {{ opacity: 0.8; }}"
+    )
+
+
+def _read_image(path: str, max_side: int) -> QImage:
+    """Decode *path*, reduced so its longer side is at most *max_side*.
+
+    The JPEG reader applies the reduction inside libjpeg, so oversized
+    photos are never decoded at full size.  0 means no limit.
+    """
+    reader = QImageReader(path)
+    size = reader.size()
+    if max_side > 0 and size.isValid() and max(size.width(), size.height()) > max_side:
+        reader.setScaledSize(size.scaled(max_side, max_side, Qt.AspectRatioMode.KeepAspectRatio))
+    return reader.read()
+
+
+class _DecodeSignals(QObject):
+    decoded = Signal(str, QImage)  # (cache key, image)
+    video_frame = Signal(str, str, QImage)  # (cache key, path, first frame)
+
+
+class _DecodeTask(QRunnable):
+    """Decodes one image on a pool thread (QImage, unlike QPixmap, is safe there)."""
+
+    def __init__(self, key: str, path: str, max_side: int, signals: _DecodeSignals):
+        super().__init__()
+        self._key = key
+        self._path = path
+        self._max_side = max_side
+        self._signals = signals
+
+    def run(self):
+        img = _read_image(self._path, self._max_side)
+        try:
+            self._signals.decoded.emit(self._key, img)
+        except RuntimeError:
+            pass  # the viewer was closed meanwhile
+
+
+class _VideoFrameTask(QRunnable):
+    """Grabs a video's first frame on a pool thread (codec setup can be slow)."""
+
+    def __init__(self, key: str, path: str, signals: _DecodeSignals):
+        super().__init__()
+        self._key = key
+        self._path = path
+        self._signals = signals
+
+    def run(self):
+        img = _video_frame(self._path)
+        if img is None:
+            img = QImage()
+        try:
+            self._signals.video_frame.emit(self._key, self._path, img)
+        except RuntimeError:
+            pass
+
+
+def _video_frame(path: str) -> QImage | None:
+    try:
+        import cv2
+        cap = cv2.VideoCapture(path)
+        ok, frame = cap.read()
+        cap.release()
+        if not ok or frame is None:
+            return None
+        h, w = frame.shape[:2]
+        # Borrow OpenCV's BGR buffer; the conversion is the one copy that
+        # detaches it, and RGB32 makes the later QPixmap a plain wrap
+        qimg = QImage(frame.data, w, h, frame.strides[0], QImage.Format.Format_BGR888)
+        return qimg.convertToFormat(QImage.Format.Format_RGB32)
+    except Exception:
+        return None
+
 
 class ViewerWindow(QDialog):
     """Modal image/video viewer with navigation and action buttons."""
@@ -46,10 +147,16 @@ class ViewerWindow(QDialog):
     ):
         # ── Initialise data BEFORE anything that can trigger resizeEvent ──
         self._items = items
+        self._item_index: dict[str, int] | None = None  # built on demand
         self._idx = max(0, min(start_index, len(items) - 1))
         self._selected = selected_list
         self._ready = False  # guard for resizeEvent
         self._current_pixmap: QPixmap | None = None
+        self._current_key: str | None = None  # QPixmapCache key of the above
+        self._current_reduced = False  # decoded below full resolution
+        # (pixmap cacheKey, width, height, fast) of what the label shows
+        self._last_scale_key: tuple | None = None
+        self._prefetching: set[str] = set()  # cache keys being decoded
         self._is_video = False
         self._video_widget = None
         self._media_player = None
@@ -70,13 +177,31 @@ class ViewerWindow(QDialog):
         )
         self.setMinimumSize(900, 620)
 
+        if QPixmapCache.cacheLimit() < VIEWER_CACHE_KB:
+            QPixmapCache.setCacheLimit(VIEWER_CACHE_KB)
+
         self._build_ui()
         self._bind_shortcuts()
 
+        self._decode_signals = _DecodeSignals(self)
+        self._decode_signals.decoded.connect(self._on_prefetched)
+        self._decode_signals.video_frame.connect(self._on_video_frame)
+        self._media_error_message = ""
+
         self._copy_feedback_timer = QTimer(self)
         self._copy_feedback_timer.setSingleShot(True)
         self._copy_feedback_timer.timeout.connect(self._restore_copy_button)
 
+        # A drag-resize sends a stream of resizeEvents; rescale once it settles
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.timeout.connect(self._on_resize_settled)
+        # ...but keep the image roughly in step meanwhile, at most this often
+        self._interim_timer = QTimer(self)
+        self._interim_timer.setSingleShot(True)
+        self._interim_timer.setInterval(100)
+        self._interim_timer.timeout.connect(self._on_resize_interim)
+
         # Mark ready *before* showMaximized so resizeEvent can work
         self._ready = True
         self.showMaximized()
@@ -226,12 +351,7 @@ class ViewerWindow(QDialog):
         btn = QPushButton(text)
         btn.setFixedWidth(48)
         btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        btn.setStyleSheet(
-            f"QPushButton {{ background: transparent; color: {COLORS['text_dim']}; "
-            f"font-size: 26px; border: none; }}"
-            f"QPushButton:hover {{ color: {COLORS['text']}; "
-            f"background: {COLORS['bg_mid']}; }}"
-        )
+        btn.setStyleSheet(_NAV_BTN_STYLE)
         return btn
 
     @staticmethod
@@ -249,13 +369,7 @@ class ViewerWindow(QDialog):
         btn = QPushButton(text)
         btn.setCursor(Qt.CursorShape.PointingHandCursor)
         btn.setFixedHeight(38)
-        btn.setStyleSheet(
-            f"QPushButton {{ background-color: {bg}; color: #ffffff; "
-            f"border: none; border-radius: 8px; padding: 6px 22px; "
-            f"font-weight: 700; font-size: 12px; }}"
-            f"QPushButton:hover {{ background-color: {hover}; }}"
-            f"QPushButton:pressed {{ opacity: 0.8; }}"
-        )
+        btn.setStyleSheet(_viewer_btn_style(bg, hover))
         return btn
 
     def _bind_shortcuts(self):
@@ -300,48 +414,144 @@ class ViewerWindow(QDialog):
 
         path = self._current_path()
         if not path:
-            self._image_label.setText("No image")
+            self._show_message("No image")
             return
 
-        ext = Path(path).suffix.lower()
+        ext = os.path.splitext(path)[1].lower()
         self._is_video = ext in VIDEO_EXTENSIONS
+        # One stat serves both the pixmap cache key and the info bar
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
 
         if self._is_video:
             self._show_video(path)
         else:
-            self._show_image(path)
+            self._show_image(path, st)
 
         # Info bar
-        self._update_info(path)
+        self._update_info(path, st)
+
+        self._refresh_action_buttons(path)
+
+        self._prefetch_neighbours()
 
-        # Button states
-        is_sel = path in self._selected
-        if is_sel:
+    def _refresh_action_buttons(self, path: str):
+        # One scan of the shared selection list (the main window owns it,
+        # so there is no index to keep in sync)
+        try:
             page_num = self._selected.index(path) + 1
-            self._btn_select.setText(f"Deselect ✓  (Page {page_num})")
-        else:
+        except ValueError:
             self._btn_select.setText("Select")
+        else:
+            self._btn_select.setText(f"Deselect ✓  (Page {page_num})")
         self._btn_crop.setVisible(not self._is_video)
         self._btn_rotate.setVisible(not self._is_video)
         self._btn_play.setVisible(self._is_video)
         self._btn_copy.setVisible(not self._is_video)
 
-    def _show_image(self, path: str):
+    def _prefetch_neighbours(self):
+        """Decode the images around the current one off the GUI thread."""
+        pool = QThreadPool.globalInstance()
+        probe = QPixmap()
+        limit = self._decode_limit()
+        for offset in PREFETCH_OFFSETS:
+            idx = self._idx + offset
+            if not 0 <= idx < len(self._items):
+                continue
+            path = self._items[idx]
+            if os.path.splitext(path)[1].lower() in VIDEO_EXTENSIONS:
+                continue
+            key = self._cache_key(path, f"ash:view@{limit}")
+            if key is None or key in self._prefetching or QPixmapCache.find(key, probe):
+                continue
+            self._prefetching.add(key)
+            pool.start(_DecodeTask(key, path, limit, self._decode_signals))
+
+    def _on_prefetched(self, key: str, img: QImage):
+        self._prefetching.discard(key)
+        if not img.isNull():
+            QPixmapCache.insert(key, QPixmap.fromImage(img))
+
+    def _show_message(self, text: str):
+        """Replace the image with *text* (placeholders and errors)."""
+        self._last_scale_key = None
+        self._image_label.setText(text)
+
+    def _show_image(self, path: str, st: os.stat_result | None = None):
         self._zoom_factor = 1.0
         self._pinch_base_zoom = 1.0
         self._media_stack.setCurrentIndex(0)
-        pm = QPixmap(path)
-        if pm and not pm.isNull():
-            self._current_pixmap = pm
+        limit = self._decode_limit()
+        if self._load_pixmap(path, limit, st):
+            self._current_reduced = max(
+                self._current_pixmap.width(), self._current_pixmap.height()
+            ) >= limit > 0
             self._apply_image_zoom(preserve_center=False)
         else:
+            self._current_reduced = False
+            self._show_message("Cannot load file")
+
+    def _load_pixmap(self, path: str, limit: int, st: os.stat_result | None = None) -> bool:
+        """Make *path*, decoded at up to *limit* px, the current pixmap."""
+        key = self._cache_key(path, f"ash:view@{limit}", st)
+        if key is not None and key == self._current_key and self._current_pixmap:
+            return True  # re-render of the same, unchanged file
+        pm = QPixmap()
+        if key is None or not QPixmapCache.find(key, pm):
+            pm = QPixmap.fromImage(_read_image(path, limit))
+            if key is not None and not pm.isNull():
+                QPixmapCache.insert(key, pm)
+        if pm.isNull():
             self._current_pixmap = None
-            self._image_label.setText("Cannot load file")
+            self._current_key = None
+            return False
+        self._current_pixmap = pm
+        self._current_key = key
+        return True
+
+    def _decode_limit(self) -> int:
+        """Longest image side worth decoding for this window's screen."""
+        screen = self.screen()
+        if screen is None:
+            return 0
+        size = screen.size()
+        side = max(size.width(), size.height()) * screen.devicePixelRatio()
+        return int(side * DECODE_ZOOM_HEADROOM)
 
-    def _apply_image_zoom(self, preserve_center: bool = True):
-        """Scale the current pixmap relative to the viewport and zoom factor."""
+    @staticmethod
+    def _cache_key(
+        path: str, prefix: str = "ash:view", st: os.stat_result | None = None,
+    ) -> str | None:
+        """QPixmapCache key for *path*, or None if the file can't be stat'ed.
+
+        The mtime is part of the key, so a rotated or re-saved file is
+        decoded afresh instead of served stale.  Pass *st* to reuse a
+        stat the caller already has.
+        """
+        if st is None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                return None
+        return f"{prefix}:{st.st_mtime_ns}:{st.st_size}:{path}"
+
+    def _apply_image_zoom(self, preserve_center: bool = True, fast: bool = False):
+        """Scale the current pixmap relative to the viewport and zoom factor.
+
+        *fast* uses nearest-neighbour scaling for interim frames (e.g.
+        mid-resize); those are not cached.
+        """
         if not self._current_pixmap:
             return
+        if self._current_reduced and self._zoom_factor > DECODE_ZOOM_HEADROOM:
+            # Zoomed past the reduced decode; switch to full resolution
+            path = self._current_path()
+            if path and self._load_pixmap(path, 0):
+                self._current_reduced = False
+            elif not self._current_pixmap:
+                return
 
         viewport = self._image_scroll.viewport().size()
         if viewport.width() <= 0 or viewport.height() <= 0:
@@ -369,14 +579,37 @@ class ViewerWindow(QDialog):
         target_width = max(1, int(self._current_pixmap.width() * target_scale))
         target_height = max(1, int(self._current_pixmap.height() * target_scale))
 
-        scaled = self._current_pixmap.scaled(
-            QSize(target_width, target_height),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
+        # Repeated resizeEvents and re-renders often land on the size that
+        # is already displayed; a smooth frame also stands in for a fast one
+        last = self._last_scale_key
+        scale_key = (self._current_pixmap.cacheKey(), target_width, target_height)
+        if last is not None and last[:3] == scale_key and (fast or not last[3]):
+            return
+
+        # Resizes and zoom steps often revisit a size; reuse those scales
+        scaled = QPixmap()
+        scaled_fast = False
+        scaled_key = (
+            f"{self._current_key}@{target_width}x{target_height}"
+            if self._current_key else None
         )
+        if (abs(target_width - self._current_pixmap.width()) <= 1
+                and abs(target_height - self._current_pixmap.height()) <= 1):
+            scaled = self._current_pixmap  # already the right size
+        elif scaled_key is None or not QPixmapCache.find(scaled_key, scaled):
+            scaled = self._current_pixmap.scaled(
+                QSize(target_width, target_height),
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.FastTransformation if fast
+                else Qt.TransformationMode.SmoothTransformation,
+            )
+            scaled_fast = fast
+            if scaled_key is not None and not fast:
+                QPixmapCache.insert(scaled_key, scaled)
 
         self._image_label.setPixmap(scaled)
         self._image_label.resize(scaled.size())
+        self._last_scale_key = (*scale_key, scaled_fast)
 
         if preserve_center:
             if scaled.width() <= viewport.width():
@@ -429,6 +662,8 @@ class ViewerWindow(QDialog):
 
     def _show_video(self, path: str):
         self._current_pixmap = None
+        self._current_key = None
+        self._current_reduced = False
         self._ensure_video_widgets()
         self._media_stack.setCurrentIndex(1)
         if self._media_player:
@@ -457,48 +692,57 @@ class ViewerWindow(QDialog):
         if not path:
             return
         self._media_stack.setCurrentIndex(0)
-        pm = self._video_frame(path)
-        if pm and not pm.isNull():
-            self._current_pixmap = pm
-            self._scale_image()
+        self._media_error_message = message
+        key = self._cache_key(path, "ash:vf")
+        if key is None:
+            self._show_message(f"Cannot play video: {message}")
+            return
+        pm = QPixmap()
+        if QPixmapCache.find(key, pm):
+            self._show_video_frame(key, pm)
+            return
+        self._show_message("Loading…")
+        if key not in self._prefetching:
+            self._prefetching.add(key)
+            QThreadPool.globalInstance().start(
+                _VideoFrameTask(key, path, self._decode_signals)
+            )
+
+    def _on_video_frame(self, key: str, path: str, img: QImage):
+        self._prefetching.discard(key)
+        pm = QPixmap.fromImage(img) if not img.isNull() else QPixmap()
+        if not pm.isNull():
+            QPixmapCache.insert(key, pm)
+        # Only show it if the user is still on that video
+        if not self._is_video or path != self._current_path():
+            return
+        if pm.isNull():
+            self._show_message(f"Cannot play video: {self._media_error_message}")
         else:
-            self._image_label.setText(f"Cannot play video: {message}")
+            self._show_video_frame(key, pm)
 
-    def _update_info(self, path: str):
-        try:
-            p = Path(path)
-            sz = p.stat().st_size
-            nice = self._nice_size(sz)
-            self._info_label.setText(
-                f"{p.name}   •   {nice}   •   "
-                f"{self._idx + 1} / {len(self._items)}"
-            )
-        except OSError:
-            self._info_label.setText(Path(path).name)
+    def _show_video_frame(self, key: str, pm: QPixmap):
+        self._current_pixmap = pm
+        self._current_key = key
+        self._apply_image_zoom(preserve_center=False)
 
-    @staticmethod
-    def _video_frame(path: str) -> QPixmap | None:
-        try:
-            import cv2
-            cap = cv2.VideoCapture(path)
-            ok, frame = cap.read()
-            cap.release()
-            if not ok or frame is None:
-                return None
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            h, w, ch = frame.shape
-            qimg = QImage(frame.data, w, h, w * ch, QImage.Format.Format_RGB888)
-            return QPixmap.fromImage(qimg.copy())
-        except Exception:
-            return None
+    def _update_info(self, path: str, st: os.stat_result | None):
+        name = os.path.basename(path)
+        if st is None:
+            self._info_label.setText(name)
+            return
+        self._info_label.setText(
+            f"{name}   •   {self._nice_size(st.st_size)}   •   "
+            f"{self._idx + 1} / {len(self._items)}"
+        )
 
     @staticmethod
     def _nice_size(b: int) -> str:
-        for u in ("B", "KB", "MB", "GB"):
-            if b < 1024:
-                return f"{b:.1f} {u}" if u != "B" else f"{b} {u}"
-            b /= 1024
-        return f"{b:.1f} TB"
+        if b < 1024:
+            return f"{b} B"
+        # Each unit is 10 more bits; the bit length picks it without a loop
+        i = min((b.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{b / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
 
     # ────────────────── navigation ──────────────────
 
@@ -519,8 +763,8 @@ class ViewerWindow(QDialog):
         if path:
             self.request_select.emit(path)
             # The shared _selected set is toggled by main window synchronously;
-            # just refresh the UI to reflect the new state.
-            self._show_current()
+            # only the buttons reflect it, so leave the media alone.
+            self._refresh_action_buttons(path)
 
     def _on_crop(self):
         path = self._current_path()
@@ -561,13 +805,16 @@ class ViewerWindow(QDialog):
         self._toast.setText(message)
         self._toast.adjustSize()
         self._toast.setFixedWidth(max(self._toast.sizeHint().width() + 48, 280))
-        x = (self.width() - self._toast.width()) // 2
-        y = self.height() - 110
-        self._toast.move(x, y)
+        self._place_toast()
         self._toast.raise_()
         self._toast.show()
         self._toast_timer.start(duration_ms)
 
+    def _place_toast(self):
+        x = (self.width() - self._toast.width()) // 2
+        y = self.height() - 110
+        self._toast.move(x, y)
+
     def _restore_copy_button(self):
         if not self._copy_feedback_active:
             return
@@ -577,9 +824,14 @@ class ViewerWindow(QDialog):
 
     def confirm_removal(self, path: str):
         """Called by the main window after a successful delete / hide."""
-        if path in self._items:
-            idx = self._items.index(path)
+        if self._item_index is None:
+            self._item_index = {p: i for i, p in enumerate(self._items)}
+        idx = self._item_index.pop(path, None)
+        if idx is not None:
             self._items.pop(idx)
+            index = self._item_index
+            for p in self._items[idx:]:
+                index[p] -= 1
             if self._idx >= len(self._items):
                 self._idx = max(0, len(self._items) - 1)
             if self._items:
@@ -587,6 +839,12 @@ class ViewerWindow(QDialog):
             else:
                 self.close()
 
+    def set_items(self, items: list[str]):
+        """Replace the navigation list, keeping the current index."""
+        self._items = items
+        self._item_index = None
+        self._idx = max(0, min(self._idx, len(items) - 1))
+
     # ────────────────── standalone mode ──────────────────
 
     def set_standalone_mode(self, standalone: bool):
@@ -602,13 +860,24 @@ class ViewerWindow(QDialog):
         super().resizeEvent(event)
         if not self._ready:
             return
+        # A drag-resize sends a dense stream of these; rescaling waits for the timers
+        self._resize_timer.start(40)
+        if not self._interim_timer.isActive():
+            self._interim_timer.start()
+        # Moving the toast is cheap, so it follows the window without delay
+        if self._toast.isVisible():
+            self._place_toast()
+
+    def _on_resize_interim(self):
+        # Cheap nearest-neighbour frame while a drag-resize is still going
+        if self._resize_timer.isActive() and not self._is_video and self._current_pixmap:
+            self._apply_image_zoom(preserve_center=True, fast=True)
+
+    def _on_resize_settled(self):
+        self._interim_timer.stop()
         # Only re-scale images; video widget auto-resizes
         if not self._is_video and self._current_pixmap:
             self._apply_image_zoom(preserve_center=True)
-        if self._toast.isVisible():
-            x = (self.width() - self._toast.width()) // 2
-            y = self.height() - 110
-            self._toast.move(x, y)
 
     def eventFilter(self, watched, event):
         if watched is self._image_scroll.viewport():